@@ -414,52 +414,40 @@ def pwm_freq(dev, freq):
         send_command(dev, CommandVals.PwmFreq, [3])
 
 
+# Pattern name -> how to show it; the names match PATTERNS.
+_PATTERNS = {
+    "All LEDs on": lambda dev: send_command(dev, CommandVals.Pattern, [PatternVals.FullBrightness]),
+    "Gradient (0-13% Brightness)": lambda dev: send_command(dev, CommandVals.Pattern, [PatternVals.Gradient]),
+    "Double Gradient (0-7-0% Brightness)": lambda dev: send_command(dev, CommandVals.Pattern, [PatternVals.DoubleGradient]),
+    '"LOTUS" sideways': lambda dev: send_command(dev, CommandVals.Pattern, [PatternVals.DisplayLotus]),
+    "Zigzag": lambda dev: send_command(dev, CommandVals.Pattern, [PatternVals.ZigZag]),
+    '"PANIC"': lambda dev: send_command(dev, CommandVals.Pattern, [PatternVals.DisplayPanic]),
+    '"LOTUS" Top Down': lambda dev: send_command(dev, CommandVals.Pattern, [PatternVals.DisplayLotus2]),
+    "All brightness levels (1 LED each)": lambda dev: all_brightnesses(dev),
+    "Every Second Row": lambda dev: every_nth_row(dev, 2),
+    "Every Third Row": lambda dev: every_nth_row(dev, 3),
+    "Every Fourth Row": lambda dev: every_nth_row(dev, 4),
+    "Every Fifth Row": lambda dev: every_nth_row(dev, 5),
+    "Every Sixth Row": lambda dev: every_nth_row(dev, 6),
+    "Every Second Col": lambda dev: every_nth_col(dev, 2),
+    "Every Third Col": lambda dev: every_nth_col(dev, 3),
+    "Every Fourth Col": lambda dev: every_nth_col(dev, 4),
+    "Every Fifth Col": lambda dev: every_nth_col(dev, 5),
+    "Checkerboard": lambda dev: checkerboard(dev, 1),
+    "Double Checkerboard": lambda dev: checkerboard(dev, 2),
+    "Triple Checkerboard": lambda dev: checkerboard(dev, 3),
+    "Quad Checkerboard": lambda dev: checkerboard(dev, 4),
+}
+
+
 def pattern(dev, p):
     """Display a pattern that's already programmed into the firmware"""
-    if p == "All LEDs on":
-        send_command(dev, CommandVals.Pattern, [PatternVals.FullBrightness])
-    elif p == "Gradient (0-13% Brightness)":
-        send_command(dev, CommandVals.Pattern, [PatternVals.Gradient])
-    elif p == "Double Gradient (0-7-0% Brightness)":
-        send_command(dev, CommandVals.Pattern, [PatternVals.DoubleGradient])
-    elif p == '"LOTUS" sideways':
-        send_command(dev, CommandVals.Pattern, [PatternVals.DisplayLotus])
-    elif p == "Zigzag":
-        send_command(dev, CommandVals.Pattern, [PatternVals.ZigZag])
-    elif p == '"PANIC"':
-        send_command(dev, CommandVals.Pattern, [PatternVals.DisplayPanic])
-    elif p == '"LOTUS" Top Down':
-        send_command(dev, CommandVals.Pattern, [PatternVals.DisplayLotus2])
-    elif p == "All brightness levels (1 LED each)":
-        all_brightnesses(dev)
-    elif p == "Every Second Row":
-        every_nth_row(dev, 2)
-    elif p == "Every Third Row":
-        every_nth_row(dev, 3)
-    elif p == "Every Fourth Row":
-        every_nth_row(dev, 4)
-    elif p == "Every Fifth Row":
-        every_nth_row(dev, 5)
-    elif p == "Every Sixth Row":
-        every_nth_row(dev, 6)
-    elif p == "Every Second Col":
-        every_nth_col(dev, 2)
-    elif p == "Every Third Col":
-        every_nth_col(dev, 3)
-    elif p == "Every Fourth Col":
-        every_nth_col(dev, 4)
-    elif p == "Every Fifth Col":
-        every_nth_col(dev, 4)
-    elif p == "Checkerboard":
-        checkerboard(dev, 1)
-    elif p == "Double Checkerboard":
-        checkerboard(dev, 2)
-    elif p == "Triple Checkerboard":
-        checkerboard(dev, 3)
-    elif p == "Quad Checkerboard":
-        checkerboard(dev, 4)
-    else:
+    show = _PATTERNS.get(p)
+    if show is None:
         print("Invalid pattern")
+        return
+
+    show(dev)
 
 
 def show_string(dev, s):
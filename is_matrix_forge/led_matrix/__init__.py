@@ -1,3 +1,41 @@
+from importlib import import_module
+
+
+# Names other modules import straight from this package, and the submodule that defines each. They are resolved on
+# first access by `__getattr__` (PEP 562) rather than imported here, so importing the package stays cheap and
+# doesn't run into the circular imports eager re-exports would cause.
+_LAZY_EXPORTS = {
+    'LEDMatrixController': 'is_matrix_forge.led_matrix.controller.controller',
+    'render_matrix':       'is_matrix_forge.led_matrix.display.helpers',
+    'send_col':            'is_matrix_forge.led_matrix.display.helpers.columns',
+    'commit_cols':         'is_matrix_forge.led_matrix.display.helpers.columns',
+    'animate':             'is_matrix_forge.led_matrix.hardware',
+    'get_animate':         'is_matrix_forge.led_matrix.hardware',
+    'brightness':          'is_matrix_forge.led_matrix.hardware',
+    'percentage':          'is_matrix_forge.led_matrix.hardware',
+    'disconnect_dev':      'is_matrix_forge.led_matrix.helpers',
+    'send_serial':         'is_matrix_forge.led_matrix.helpers',
+    'FWK_MAGIC':           'is_matrix_forge.led_matrix.constants',
+    'RESPONSE_SIZE':       'is_matrix_forge.led_matrix.constants',
+}
+
+
+def __getattr__(name):
+    try:
+        module = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}') from None
+
+    value = getattr(import_module(module), name)
+    # Later lookups find it as a plain module global and never come back here.
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
+
 
 
 def get_controllers():
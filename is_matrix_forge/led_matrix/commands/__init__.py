@@ -15,22 +15,138 @@ Description:
     
 
 """
-from typing import List, Optional, ByteString
+import atexit
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, ByteString, Union
 
 import serial
 from serial.tools.list_ports_common import ListPortInfo
 
-from is_matrix_forge.led_matrix.constants import RESPONSE_SIZE, FWK_MAGIC
-from is_matrix_forge.led_matrix.helpers import disconnect_dev
+from is_matrix_forge.led_matrix.constants import DISCONNECTED_DEVS, RESPONSE_SIZE, FWK_MAGIC
+from is_matrix_forge.led_matrix.commands.map import CommandVals
+from is_matrix_forge.led_matrix.helpers import LAST_DRAW, disconnect_dev, enable_low_latency, record_draw
 
 
-def send_command_raw(dev: ListPortInfo, command: List[int], with_response: bool = False, response_size: Optional[int] = None) -> Optional[ByteString]:
+WRITE_TIMEOUT = 1.0
+"""float: Seconds a command write may block before it is treated as a failed device."""
+
+READ_TIMEOUT = 1.0
+"""float: Seconds to wait for a command's response before giving up on it (the read then returns short)."""
+
+_PORT_POOL: Dict[str, serial.Serial] = {}
+"""dict[str, serial.Serial]: The open connection to each device, by port."""
+
+_PORT_LOCKS: Dict[str, threading.RLock] = {}
+_PORT_LOCKS_LOCK = threading.Lock()
+
+
+def _port_lock(port: str) -> threading.RLock:
+    with _PORT_LOCKS_LOCK:
+        lock = _PORT_LOCKS.get(port)
+        if lock is None:
+            lock = _PORT_LOCKS[port] = threading.RLock()
+
+        return lock
+
+
+def _drop_port(port: str) -> None:
+    s = _PORT_POOL.pop(port, None)
+    if s is not None:
+        try:
+            s.close()
+        except (IOError, OSError):
+            pass
+
+
+@atexit.register
+def close_ports() -> None:
+    """
+    Close every pooled device connection.
+
+    A port still borrowed after `WRITE_TIMEOUT + READ_TIMEOUT` seconds is skipped rather than waited on, so a stuck
+    borrower can't hang interpreter exit.
+    """
+    for port in list(_PORT_POOL):
+        lock = _port_lock(port)
+        if not lock.acquire(timeout=WRITE_TIMEOUT + READ_TIMEOUT):
+            continue
+
+        try:
+            _drop_port(port)
+        finally:
+            lock.release()
+
+
+@contextmanager
+def exclusive_port(port: str) -> Iterator[None]:
+    """
+    Close the pooled connection to a port and keep the port locked for the block.
+
+    For code that has to open the port itself; without this, its connection and the pooled one would both be open on
+    the same device.
+
+    Parameters:
+        port (str):
+            The device's port.
+    """
+    with _port_lock(port):
+        _drop_port(port)
+        yield
+
+
+@contextmanager
+def pooled_port(dev: ListPortInfo) -> Iterator[serial.Serial]:
+    """
+    Borrow the shared serial connection to a device, opening it on first use.
+
+    Opening and configuring the port costs far more than a typical command, so one connection per device is kept
+    for the whole session (and closed at exit). The device is locked while borrowed, so keep the block short; code
+    that streams to a device for a long time should borrow it once per frame rather than for the whole stream.
+
+    Parameters:
+        dev (ListPortInfo):
+            The device to connect to.
+
+    Yields:
+        serial.Serial:
+            The open connection. It is closed and dropped from the pool if the block raises an I/O error or marks
+            the device disconnected, so the next borrower reopens it (and, once that succeeds, the device is no
+            longer counted as disconnected).
+
+    Raises:
+        IOError, OSError: If the port can't be opened.
+    """
+    port = dev.device
+    with _port_lock(port):
+        s = _PORT_POOL.get(port)
+        if s is None or not s.is_open:
+            s = serial.Serial(port, 115200, timeout=READ_TIMEOUT, write_timeout=WRITE_TIMEOUT)
+            enable_low_latency(s)
+            _PORT_POOL[port] = s
+
+            # It answered to a fresh connection, so whatever failed before was transient.
+            if port in DISCONNECTED_DEVS:
+                DISCONNECTED_DEVS.remove(port)
+
+        try:
+            yield s
+        except (IOError, OSError):
+            _drop_port(port)
+            raise
+
+        # Marked disconnected during this borrow (an error the block caught itself); reopen on the next one.
+        if port in DISCONNECTED_DEVS:
+            _drop_port(port)
+
+
+def send_command_raw(dev: ListPortInfo, command: Union[ByteString, List[int]], with_response: bool = False, response_size: Optional[int] = None) -> Optional[ByteString]:
     """
-    Send a command to the device using a new serial connection.
+    Send a command to the device over its pooled serial connection.
 
     Args:
         dev (ListPortInfo): The device to send the command to.
-        command (List[int]): The command to send.
+        command (Union[ByteString, List[int]]): The command to send.
         with_response (bool, optional): Whether to wait for a response from the device. Defaults to False.
         response_size (Optional[int], optional): The size of the response to expect. Defaults to None.
 
@@ -42,10 +158,21 @@ def send_command_raw(dev: ListPortInfo, command: List[int], with_response: bool
     """
     # print(f"Sending command: {command}")
     res_size = response_size or RESPONSE_SIZE
+
+    # Any command may change what is on screen; only a completed Draw tells us what it is.
+    LAST_DRAW.pop(dev.device, None)
     try:
-        with serial.Serial(dev.device, 115200) as s:
+        with pooled_port(dev) as s:
+            if with_response:
+                # Don't let anything left over on the shared connection be read as this command's response.
+                s.reset_input_buffer()
+
+            # One write of the whole frame; the caller has already assembled it into a single buffer.
             s.write(command)
 
+            if len(command) > 2 and command[2] == CommandVals.Draw:
+                record_draw(dev.device, command[3:])
+
             return s.read(res_size) if with_response else None
     except (IOError, OSError) as _ex:
         disconnect_dev(dev.device)
@@ -56,11 +183,11 @@ def send_command_raw(dev: ListPortInfo, command: List[int], with_response: bool
 def send_command(
         dev:           ListPortInfo,
         command:       int,
-        parameters:    Optional[List[int]] = None,
+        parameters:    Optional[Union[ByteString, List[int]]] = None,
         with_response: bool                = False
 ) -> Optional[ByteString]:
     """
-    Send a command to the device using a new serial connection.
+    Send a command to the device over its pooled serial connection.
 
     Parameters:
         dev (ListPortInfo):
@@ -69,8 +196,8 @@ def send_command(
         command (int):
             The command to send.
 
-        parameters (Optional[List[int]], optional):
-            The parameters to send with the command. Defaults to None.
+        parameters (Optional[Union[ByteString, List[int]]], optional):
+            The parameters to send with the command, as a list of ints or a bytes-like payload. Defaults to None.
 
         with_response (bool, optional):
             Whether to wait for a response from the device. Defaults to False.
@@ -79,6 +206,9 @@ def send_command(
         Optional[ByteString]:
             The response from the device, if any, or None if no response or an error occurred.
     """
-    if parameters is None:
-        parameters = []
-    return send_command_raw(dev, FWK_MAGIC + [command] + parameters, with_response)
+    buf = bytearray(FWK_MAGIC)
+    buf.append(command)
+    if parameters:
+        buf += bytes(parameters)
+
+    return send_command_raw(dev, buf, with_response)
@@ -405,10 +405,30 @@ class LEDMatrixController(metaclass=MultitonMeta):
         from is_matrix_forge.led_matrix.display.grid import Grid
         from is_matrix_forge.led_matrix.display.helpers import render_matrix
 
-        grid = grid or self.grid
+        if grid is None:
+            grid = self.grid
         if not isinstance(grid, Grid):
             grid = Grid(init_grid=grid)
-        render_matrix(self.device, grid.grid)
+
+        # Hand over the Grid itself, so a 9x34 one sends its cached `Grid.to_wire` payload instead of being repacked.
+        render_matrix(self.device, grid)
+
+    @synchronized
+    def draw_grid_bytes(self, payload: bytes) -> None:
+        """
+        Draw an already-serialised grid on the LED matrix.
+
+        Parameters:
+            payload (bytes):
+                The 39-byte Draw payload, as produced by `Grid.to_wire`.
+        """
+        from is_matrix_forge.led_matrix.helpers import is_showing
+
+        # Same rule as `render_matrix`: don't resend the frame the device is already showing.
+        if is_showing(self.device.device, payload):
+            return
+
+        send_command(self.device, COMMANDS.Draw, payload)
 
     @synchronized
     @method_alias('pattern')
@@ -6,7 +6,7 @@ from time import sleep
 from typing import List, Any, Union
 from is_matrix_forge.led_matrix.display.grid.helpers import is_valid_grid
 
-from is_matrix_forge.led_matrix import render_matrix
+from is_matrix_forge.led_matrix.display.helpers import render_matrix
 from is_matrix_forge.led_matrix.display.grid.grid import Grid
 from is_matrix_forge.led_matrix.display.grid.helpers import generate_blank_grid
 
@@ -26,8 +26,8 @@ class Frame:
         if grid is None:
             grid = generate_blank_grid()
         elif isinstance(grid, Grid):
-            # Grid stores column-major lists in _grid
-            grid = getattr(grid, '_grid', list(grid))
+            # Grid keeps its pixels in an array; take the column-major list form
+            grid = grid.grid
 
         # Determine dimensions from column-major layout
         self.__width = len(grid)
@@ -0,0 +1,138 @@
+"""
+Compiled pixel kernels for `Grid`.
+
+The kernels operate directly on ``uint8[:, :]`` column-major arrays and are compiled with Numba when it is installed
+(``pip install led-matrix-battery[jit]``). Without Numba they are plain Python functions; callers should check
+`HAS_NUMBA` and prefer their NumPy paths in that case.
+"""
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - depends on the environment
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """Stand-in for `numba.njit` that leaves the function uncompiled."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        return lambda func: func
+else:
+    HAS_NUMBA = True
+
+
+@njit(cache=True)
+def shift_kernel(src: np.ndarray, dst: np.ndarray, dx: int, dy: int, wrap: bool, fill: int) -> None:
+    """
+    Write `src` shifted by (dx, dy) into `dst`, so that ``dst[c, r] == src[c + dx, r + dy]``.
+
+    Parameters:
+        src (np.ndarray):
+            The (width, height) source array.
+
+        dst (np.ndarray):
+            A preallocated array of the same shape; every element is written.
+
+        dx (int):
+            Column offset.
+
+        dy (int):
+            Row offset.
+
+        wrap (bool):
+            Wrap around the edges instead of filling.
+
+        fill (int):
+            Value for pixels whose source falls outside the grid (ignored when wrapping).
+    """
+    width, height = src.shape
+
+    for c in range(width):
+        sc = c + dx
+        for r in range(height):
+            sr = r + dy
+            if wrap:
+                dst[c, r] = src[sc % width, sr % height]
+            elif 0 <= sc < width and 0 <= sr < height:
+                dst[c, r] = src[sc, sr]
+            else:
+                dst[c, r] = fill
+
+
+@njit(cache=True)
+def animate_kernel(
+        src:     np.ndarray,
+        out:     np.ndarray,
+        dx:      int,
+        dy:      int,
+        wrap:    bool,
+        fill:    int,
+        overlay: np.ndarray
+) -> None:
+    """
+    Fill ``out[n]`` with ``out[n - 1]`` (``src`` for the first frame) shifted by (dx, dy) and OR-ed with `overlay`.
+
+    Parameters:
+        src (np.ndarray):
+            The (width, height) starting array.
+
+        out (np.ndarray):
+            A preallocated (frames, width, height) array; every element is written.
+
+        dx (int):
+            Column offset applied at each step.
+
+        dy (int):
+            Row offset applied at each step.
+
+        wrap (bool):
+            Wrap around the edges instead of filling.
+
+        fill (int):
+            Value for vacated pixels (ignored when wrapping).
+
+        overlay (np.ndarray):
+            A (width, height) array drawn over every frame, or an empty array for none.
+    """
+    if out.shape[0] == 0:
+        return
+
+    shift_kernel(src, out[0], dx, dy, wrap, fill)
+    for f in range(out.shape[0]):
+        if f:
+            shift_kernel(out[f - 1], out[f], dx, dy, wrap, fill)
+        if overlay.size:
+            out[f] |= overlay
+
+
+@njit(cache=True)
+def pack_kernel(matrix: np.ndarray, width: int, height: int) -> np.ndarray:
+    """
+    Pack the top-left (width, height) area of a column-major matrix into the device's Draw payload.
+
+    Pixel (x, y) is lit when non-zero and lands on bit ``x + width * y``, least-significant bit first.
+
+    Parameters:
+        matrix (np.ndarray):
+            A 2-D array at least (width, height) in size.
+
+        width (int):
+            Number of columns to pack.
+
+        height (int):
+            Number of rows to pack.
+
+    Returns:
+        np.ndarray:
+            The packed ``uint8`` payload, ``ceil(width * height / 8)`` bytes long.
+    """
+    out = np.zeros((width * height + 7) // 8, dtype=np.uint8)
+
+    for x in range(width):
+        for y in range(height):
+            if matrix[x, y]:
+                i = x + width * y
+                out[i >> 3] |= np.uint8(1 << (i & 7))
+
+    return out
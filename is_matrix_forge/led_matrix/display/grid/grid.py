@@ -17,12 +17,20 @@ Description:
     loading from files.
 """
 
+import hashlib
 import itertools
+import os
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Union, ClassVar, Type, Any, Dict  # Added Any, Dict
+from typing import Any, ClassVar, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
 from ...constants import WIDTH as __WIDTH, HEIGHT as __HEIGHT, PRESETS_DIR
-from .helpers import is_valid_grid, generate_blank_grid
-from is_matrix_forge.common.helpers import coerce_to_int
+from is_matrix_forge.dev_tools.presets import MANIFEST_FILE_NAME
+from .helpers import is_valid_grid, generate_blank_grid, grid_to_bytes, shift_bits
+from ._kernels import HAS_NUMBA, animate_kernel, shift_kernel
+from ...helpers import load_from_file
 
 MATRIX_HEIGHT = __HEIGHT
 """int: Height of the LED matrix grid in pixels.
@@ -35,6 +43,232 @@ This constant defines the default width for new Grid instances and for loading o
 """
 
 
+@lru_cache(maxsize=64)
+def _cached_load(path: str, mtime_ns: int) -> Any:
+    """
+    Parse a grid/animation file once per modification time.
+
+    The mtime (``st_mtime_ns``) is part of the cache key, so editing the file on disk invalidates its entry
+    automatically; nanoseconds keep two edits within the same float-rounded second apart.
+    """
+    return load_from_file(path)
+
+
+def _extract_grid_data(raw: Any) -> List[List[List[int]]]:
+    """Pull the raw column-major grid lists out of a parsed grid/animation file, one per frame."""
+    # Parsed JSON only ever holds plain lists and dicts, so exact type checks are enough (and cheaper per frame).
+    if type(raw) is not list:
+        raise ValueError("Unsupported file structure for grid data.")
+
+    # Single-grid JSON (list of columns), or a bare list of such grids
+    if raw and type(raw[0]) is list:
+        if raw[0] and type(raw[0][0]) is list:
+            return raw
+        return [raw]
+
+    # Frame-list JSON: list of dicts
+    grids = []
+    for number, frame in enumerate(raw):
+        if type(frame) is not dict:
+            raise ValueError("Unsupported file structure for grid data.")
+
+        try:
+            grid_data = frame['grid']
+        except KeyError:
+            grid_data = None
+
+        if type(grid_data) is not list:
+            raise ValueError(f"Frame {number} missing 'grid' list")
+        grids.append(grid_data)
+
+    return grids
+
+
+@lru_cache(maxsize=64)
+def _cached_frames(
+        path:   str,
+        stamp:  Optional[Tuple[int, int]],
+        width:  int,
+        height: int
+) -> Tuple[np.ndarray, ...]:
+    """
+    Parse and validate every frame of a grid/animation file, returning them as read-only arrays.
+
+    `stamp` is the file's ``(st_size, st_mtime_ns)``. Callers with no usable stamp (the file can't be stat'ed) should
+    use `_cached_frames.__wrapped__` so that nothing is cached for them.
+    """
+    sidecar = _sidecar_path(path, stamp, width, height) if stamp is not None else None
+    if sidecar is not None:
+        stack = _read_sidecar(sidecar)
+        if stack is not None:
+            return tuple(frame.view(np.ndarray) for frame in stack)
+
+    raw = _cached_load(path, stamp[1]) if stamp is not None else load_from_file(path)
+
+    frames = []
+    for grid_data in _extract_grid_data(raw):
+        if not is_valid_grid(grid_data, width, height):
+            raise ValueError(f"Loaded grid is not {width}×{height} column-major 0/1 list")
+
+        arr = np.array(grid_data, dtype=np.uint8)
+        arr.flags.writeable = False
+        frames.append(arr)
+
+    if sidecar is not None and frames:
+        _write_sidecar(sidecar, np.stack(frames))
+
+    return tuple(frames)
+
+
+def _sidecar_path(path: str, stamp: Tuple[int, int], width: int, height: int) -> Optional[Path]:
+    """
+    Location of the binary frame cache for `path` at the given size and ``(st_size, st_mtime_ns)`` stamp, or None if
+    `path` isn't a preset.
+
+    Sidecars live under ``PRESETS_DIR/.cache`` and are only kept for files in `PRESETS_DIR`. The stamp is part of the
+    name, so a cache is only ever used for the exact version of the file it was made from (a file restored or copied
+    with an older mtime included).
+    """
+    path = os.path.abspath(path)
+    presets = os.path.abspath(PRESETS_DIR)
+    try:
+        if os.path.commonpath((path, presets)) != presets:
+            return None
+    except ValueError:  # different drives
+        return None
+
+    key = f'{path}|{width}x{height}'.encode('utf-8')
+    size, mtime_ns = stamp
+    return Path(presets) / '.cache' / f'{hashlib.sha1(key).hexdigest()[:16]}-{size}-{mtime_ns}.npy'
+
+
+def _read_sidecar(sidecar: Path) -> Optional[np.ndarray]:
+    """Memory-map a frame cache written by `_write_sidecar`, or return None if there is none."""
+    try:
+        return np.load(sidecar, mmap_mode='r')
+    except (OSError, ValueError):
+        return None
+
+
+def _write_sidecar(sidecar: Path, stack: np.ndarray) -> None:
+    """
+    Save the (frames, width, height) array for `_read_sidecar`, removing the caches of older versions of the same file.
+
+    Failures just mean no cache next time.
+    """
+    try:
+        sidecar.parent.mkdir(parents=True, exist_ok=True)
+        tmp = sidecar.with_suffix(f'.{os.getpid()}.tmp')
+        with open(tmp, 'wb') as f:
+            np.save(f, stack)
+        os.replace(tmp, sidecar)
+    except OSError:
+        return
+
+    source_key = sidecar.name.split('-', 1)[0]
+    for stale in sidecar.parent.glob(f'{source_key}-*.npy'):
+        if stale != sidecar:
+            try:
+                stale.unlink(missing_ok=True)
+            except OSError:
+                pass
+
+
+def _is_valid_grid_np(arr: np.ndarray, width: int, height: int) -> bool:
+    """
+    Array counterpart of `is_valid_grid`: shape must be (width, height) and every value 0 or 1.
+
+    Runs as vectorised reductions rather than a Python loop over every pixel. Boolean arrays need no value check,
+    and unsigned ones only a single `max`; other dtypes compare each value against 0 and 1.
+    """
+    if arr.shape != (width, height):
+        return False
+
+    kind = arr.dtype.kind
+    if kind == 'b' or not arr.size:
+        return True
+
+    if kind == 'u':
+        return bool(arr.max() <= 1)
+
+    if kind == 'i':
+        return bool(arr.min() >= 0 and arr.max() <= 1)
+
+    return bool(np.logical_or(arr == 0, arr == 1).all())
+
+
+def _valid_grid(value: Union[List[List[int]], np.ndarray, 'Grid'], width: int, height: int) -> bool:
+    """
+    Validate `value` with the array fast path when possible, falling back to `is_valid_grid` for lists.
+
+    Another `Grid` was validated when it was built, so only its size is checked.
+    """
+    if isinstance(value, Grid):
+        return (value.width, value.height) == (width, height)
+
+    if isinstance(value, np.ndarray):
+        return _is_valid_grid_np(value, width, height)
+
+    return is_valid_grid(value, width, height)
+
+
+def _to_array(value: Union[List[List[int]], np.ndarray, 'Grid']) -> np.ndarray:
+    """Copy already-validated grid data into a fresh uint8 array."""
+    if isinstance(value, Grid):
+        return value._grid.copy()
+
+    if isinstance(value, list) and value:
+        # Flattening validated 0/1 columns straight into one bytearray is about twice as fast as np.array's
+        # nested-sequence discovery; non-int cells (e.g. 1.0) take the general path.
+        try:
+            flat = bytearray(itertools.chain.from_iterable(value))
+        except TypeError:
+            pass
+        else:
+            return np.frombuffer(flat, dtype=np.uint8).reshape(len(value), -1)
+
+    return np.array(value, dtype=np.uint8)
+
+
+def _shift_into(src: np.ndarray, dst: np.ndarray, dx: int, dy: int, wrap: bool, fill_value: int) -> None:
+    """
+    Write `src` shifted by (dx, dy) into the preallocated `dst` (see `Grid.get_shifted` for the semantics).
+
+    Uses the compiled `shift_kernel` when Numba is available, otherwise NumPy slicing.
+    """
+    if HAS_NUMBA:
+        shift_kernel(src, dst, dx, dy, wrap, fill_value)
+        return
+
+    width, height = src.shape
+
+    if wrap:
+        if not src.size:
+            return
+
+        # Copy the (up to) four wrapped blocks straight into `dst`; np.roll would build a temporary and copy it again.
+        dx %= width
+        dy %= height
+        cols = ((slice(0, width - dx), slice(dx, width)), (slice(width - dx, width), slice(0, dx)))
+        rows = ((slice(0, height - dy), slice(dy, height)), (slice(height - dy, height), slice(0, dy)))
+        for dst_c, src_c in cols:
+            for dst_r, src_r in rows:
+                dst[dst_c, dst_r] = src[src_c, src_r]
+        return
+
+    dst.fill(fill_value)
+
+    # Anything shifted a full width/height or more leaves only fill behind.
+    if abs(dx) < width and abs(dy) < height:
+        # Destination/source column and row windows that stay in bounds.
+        dst_c = slice(max(0, -dx), min(width, width - dx))
+        src_c = slice(max(0, dx), min(width, width + dx))
+        dst_r = slice(max(0, -dy), min(height, height - dy))
+        src_r = slice(max(0, dy), min(height, height + dy))
+
+        dst[dst_c, dst_r] = src[src_c, src_r]
+
+
 class Grid:
     """
     Represents a 2D column-major grid for the LED display (grid[x][y], 9×34).
@@ -42,27 +276,37 @@ class Grid:
 
     The Grid class allows for the management of pixel data in a column-major format,
     supporting operations such as shifting, drawing, and loading from specifications or files.
+
+    Pixel data is held in a single contiguous ``numpy.uint8`` array of shape (width, height);
+    the list-of-lists form is only produced on request (see `grid`).
     """
 
+    # Preset stem -> path, rebuilt only when PRESETS_DIR's mtime changes (see `_scan_presets`).
+    _preset_registry: ClassVar[Dict[str, Path]] = {}
+    _preset_dir_mtime: ClassVar[Optional[float]] = None
+
+    # Serialised Draw payload (see `to_wire`); dropped whenever the pixels are replaced.
+    _wire_cache: Optional[bytes] = None
+
     def __init__(
         self,
         width: int = MATRIX_WIDTH,
         height: int = MATRIX_HEIGHT,
         fill_value: int = 0,
-        init_grid: List[List[int]] = None
+        init_grid: Union[List[List[int]], np.ndarray, 'Grid'] = None
     ) -> None:
         """
-        Initialize a Grid. If `init_grid` is provided, it must be column-major
-        with shape (width × height). Otherwise, create a blank grid.
+        Initialize a Grid. If `init_grid` is provided (a list of columns, an array or another Grid to copy), it must
+        be column-major with shape (width × height). Otherwise, create a blank grid.
         """
         if init_grid is not None:
-            if not is_valid_grid(init_grid, width, height):
+            if not _valid_grid(init_grid, width, height):
                 raise ValueError(f"init_grid must be {width}×{height} column-major 0/1 list")
-            self._grid = [col[:] for col in init_grid]
+            self._grid = _to_array(init_grid)
         else:
             if fill_value not in (0, 1):
                 raise ValueError("fill_value must be 0 or 1")
-            self._grid = generate_blank_grid(width=width, height=height, fill_value=fill_value)
+            self._grid = np.full((width, height), fill_value, dtype=np.uint8)
 
         self._width = width
         self._height = height
@@ -70,15 +314,48 @@ class Grid:
 
     @property
     def grid(self) -> List[List[int]]:
-        """Defensive copy of the column-major grid data."""
-        return [col[:] for col in self._grid]
+        """Defensive copy of the column-major grid data, as a list of columns."""
+        return self._grid.tolist()
 
     @grid.setter
-    def grid(self, value: List[List[int]]) -> None:
+    def grid(self, value: Union[List[List[int]], np.ndarray, 'Grid']) -> None:
         """Replace the internal grid; must be column-major and correct shape."""
-        if not is_valid_grid(value, self._width, self._height):
+        if not _valid_grid(value, self._width, self._height):
             raise ValueError(f"grid must be {self._width}×{self._height} column-major 0/1 list")
-        self._grid = [col[:] for col in value]
+        self._grid = _to_array(value)
+        self._wire_cache = None
+
+    @property
+    def array(self) -> np.ndarray:
+        """
+        Read-only view of the pixel array, shape (width, height).
+
+        Unlike `grid` this makes no copy, so it is the form to hand to renderers and other read-only consumers.
+        """
+        view = self._grid.view()
+        view.flags.writeable = False
+        return view
+
+    def __array__(self, dtype: Any = None, copy: Optional[bool] = None) -> np.ndarray:
+        """Let NumPy (e.g. ``np.asarray(grid)`` in `render_matrix`) read the pixels without a list round trip."""
+        if dtype is None and not copy:
+            return self.array
+        return self._grid.astype(dtype or np.uint8, copy=True)
+
+    def to_list(self) -> List[List[int]]:
+        """Return a copy of the grid data as a list of columns (same as `grid`)."""
+        return self._grid.tolist()
+
+    @property
+    def bits(self) -> int:
+        """
+        The grid packed into a single integer bitmap.
+
+        Pixel (x, y) is stored at bit ``x * height + y``, so a 9×34 grid fits in 306 bits. The bitmap can be
+        shifted with `shift_bits` and turned back into a grid with `from_bits`.
+        """
+        packed = np.packbits(self._grid.ravel(), bitorder='little')
+        return int.from_bytes(packed.tobytes(), 'little')
 
     @property
     def width(self) -> int:
@@ -127,8 +404,59 @@ class Grid:
         cls,
         spec: List[List[int]]
     ) -> 'Grid':
-        """Instantiate directly from a column-major spec list."""
-        return cls(init_grid=spec)
+        """
+        Instantiate directly from a column-major spec list, taking its width and height from the spec itself.
+
+        The spec is validated once here; the Grid is then built around the converted array without `__init__`
+        checking it again.
+        """
+        width = len(spec)
+        height = len(spec[0]) if width else 0
+        if not width or not height or not _valid_grid(spec, width, height):
+            raise ValueError("spec must be a non-empty, rectangular column-major 0/1 list")
+
+        return cls._from_array(_to_array(spec))
+
+    @classmethod
+    def from_bits(
+        cls,
+        bits:       int,
+        width:      int = MATRIX_WIDTH,
+        height:     int = MATRIX_HEIGHT,
+        fill_value: int = 0
+    ) -> 'Grid':
+        """Instantiate from a packed column-major bitmap (see `bits`)."""
+        size = width * height
+        raw = np.frombuffer(bits.to_bytes((size + 7) // 8, 'little'), dtype=np.uint8)
+        return cls._from_array(np.unpackbits(raw, count=size, bitorder='little').reshape(width, height), fill_value)
+
+    @classmethod
+    def _from_array(cls, arr: np.ndarray, fill_value: int = 0) -> 'Grid':
+        """
+        Wrap an array this module has just produced, skipping validation and the blank-grid allocation.
+
+        The new Grid takes ownership of `arr` (no copy), which must be a (width, height) uint8 array of 0/1 values.
+        """
+        new = cls.__new__(cls)
+        new._grid = arr
+        new._width, new._height = arr.shape
+        new._fill_value = fill_value
+        return new
+
+    @classmethod
+    def load_frames(
+        cls,
+        filename: Union[str, Path],
+        height: int = MATRIX_HEIGHT,
+        width: int = MATRIX_WIDTH
+    ) -> List['Grid']:
+        """
+        Load every frame of a grid/animation file as a list of Grids.
+
+        The file is parsed and validated once; results are cached per (path, mtime), so loading frames from the
+        same file again only touches the disk once the file changes.
+        """
+        return [cls._from_frame_array(arr) for arr in cls._load_frame_arrays(filename, width, height)]
 
     @classmethod
     def from_file(
@@ -140,37 +468,138 @@ class Grid:
     ) -> 'Grid':
         """
         Load a column-major grid from file (single grid or frames of grids).
+
+        Shares `load_frames`' cache, so stepping through `frame_number` costs one parse for the whole file.
         """
-        from ...helpers import load_from_file
-        raw = load_from_file(str(filename))
-        # Single-grid JSON: list of lists
-        if isinstance(raw, list) and raw and isinstance(raw[0], list):
-            grid_data = raw
-        # Frame-list JSON: list of dicts
-        elif isinstance(raw, list) and all(isinstance(f, dict) for f in raw):
-            frame = raw[frame_number]
-            grid_data = frame.get('grid')
-            if not isinstance(grid_data, list):
-                raise ValueError(f"Frame {frame_number} missing 'grid' list")
-        else:
-            raise ValueError("Unsupported file structure for grid data.")
+        return cls._from_frame_array(cls._load_frame_arrays(filename, width, height)[frame_number])
 
-        if not is_valid_grid(grid_data, width, height):
-            raise ValueError(f"Loaded grid is not {width}×{height} column-major 0/1 list")
+    @classmethod
+    def _scan_presets(cls) -> Dict[str, Path]:
+        """
+        Return the preset registry, rescanning `PRESETS_DIR` only if it changed since the last scan.
+
+        Returns:
+            Dict[str, Path]:
+                Mapping of preset name (file stem) to its JSON file.
+        """
+        try:
+            dir_mtime = os.path.getmtime(PRESETS_DIR)
+        except OSError:
+            cls._preset_registry, cls._preset_dir_mtime = {}, None
+            return cls._preset_registry
+
+        if dir_mtime != cls._preset_dir_mtime:
+            with os.scandir(PRESETS_DIR) as entries:
+                cls._preset_registry = {
+                    Path(entry.name).stem: Path(entry.path)
+                    for entry in entries
+                    if entry.name.endswith('.json') and entry.name != MANIFEST_FILE_NAME and entry.is_file()
+                }
+            cls._preset_dir_mtime = dir_mtime
+
+        return cls._preset_registry
+
+    @classmethod
+    def list_presets(cls) -> List[str]:
+        """Return the sorted names of the presets available in `PRESETS_DIR`."""
+        return sorted(cls._scan_presets())
+
+    @classmethod
+    def from_preset(
+        cls,
+        name: str,
+        frame_number: int = 0,
+        height: int = MATRIX_HEIGHT,
+        width: int = MATRIX_WIDTH
+    ) -> 'Grid':
+        """
+        Load a grid from a preset in `PRESETS_DIR` by name (the file's stem).
+
+        Parameters:
+            name (str):
+                The preset's name, e.g. ``'zigzag'`` for ``zigzag.json``.
 
-        return cls(width=width, height=height, init_grid=grid_data)
+            frame_number (int, optional):
+                The frame to load from an animation preset. Defaults to 0.
+
+        Returns:
+            Grid:
+                The loaded grid.
+
+        Raises:
+            FileNotFoundError:
+                If no preset with that name exists.
+        """
+        try:
+            path = cls._scan_presets()[name]
+        except KeyError:
+            raise FileNotFoundError(f"No preset named {name!r} in {PRESETS_DIR}") from None
+
+        return cls.from_file(path, frame_number=frame_number, height=height, width=width)
+
+    @staticmethod
+    def _load_frame_arrays(
+        filename: Union[str, Path],
+        width: int,
+        height: int
+    ) -> Tuple[np.ndarray, ...]:
+        """Return the cached, read-only frame arrays for `filename`."""
+        path = str(filename)
+        try:
+            st = os.stat(path)
+        except OSError:
+            # Not stat-able; skip the cache and let the loader report the problem.
+            return _cached_frames.__wrapped__(path, None, width, height)
+
+        return _cached_frames(path, (st.st_size, st.st_mtime_ns), width, height)
+
+    @classmethod
+    def _from_frame_array(cls, arr: np.ndarray) -> 'Grid':
+        """
+        Build a Grid owning a writable copy of a cached frame array.
+
+        Frames of the hardware's size loaded through `Grid` itself come back as `Grid9x34`.
+        """
+        target = Grid9x34 if cls is Grid and arr.shape == (Grid9x34.WIDTH, Grid9x34.HEIGHT) else cls
+        return target._from_array(arr.copy())
+
+    def to_wire(self) -> bytes:
+        """
+        Return the grid serialised as the matrix's Draw command payload.
+
+        Pixel (x, y) is bit ``x + width * y`` of the payload, least-significant bit first, so a 9×34 grid packs into
+        39 bytes. The result is cached until the grid is replaced, so redrawing a static image costs nothing extra.
+        """
+        if self._wire_cache is None:
+            self._wire_cache = grid_to_bytes(self._grid)
+        return self._wire_cache
 
     def draw(self, device: Any) -> None:
-        """Draw this grid via device.draw_grid(grid)."""
+        """
+        Draw this grid via device.draw_grid(grid).
+
+        Devices whose class provides ``draw_grid_bytes`` are handed the cached `to_wire` payload instead, provided
+        the grid is the hardware's size.
+        """
         if not hasattr(device, 'draw_grid') or not callable(device.draw_grid):
             raise AttributeError("device.draw_grid(grid) not available")
-        device.draw_grid(self)
+
+        if callable(getattr(type(device), 'draw_grid_bytes', None)) and \
+                (self._width, self._height) == (MATRIX_WIDTH, MATRIX_HEIGHT):
+            device.draw_grid_bytes(self.to_wire())
+        else:
+            device.draw_grid(self)
 
     def get_pixel_value(self, x: int, y: int) -> int:
         """Return the value at column x, row y."""
-        if x < 0 or x >= self._width or y < 0 or y >= self._height:
+        # NumPy already rejects indices past the end; only negative ones (which it would wrap) need a check here.
+        if x < 0 or y < 0:
             raise IndexError(f"({x},{y}) out of bounds {self._width}×{self._height}")
-        return self._grid[x][y]
+
+        try:
+            return int(self._grid[x, y])
+        except IndexError:
+            raise IndexError(f"({x},{y}) out of bounds {self._width}×{self._height}") from None
 
     def get_shifted(
         self,
@@ -179,30 +608,165 @@ class Grid:
         wrap: bool = False
     ) -> 'Grid':
         """
-        Return a new Grid shifted by (dx, dy):
-          - dx > 0 moves right, dx < 0 moves left
-          - dy > 0 moves down, dy < 0 moves up
+        Return a new Grid shifted by (dx, dy); pixel (c, r) of the result is read
+        from pixel (c + dx, r + dy) of this grid.
+
         If wrap=True, shifts wrap around edges; otherwise, out-of-bounds fill with fill_value.
         """
-        new = generate_blank_grid(self._width, self._height, self._fill_value)
+        shifted = np.empty_like(self._grid)
+        _shift_into(self._grid, shifted, dx, dy, wrap, self._fill_value)
+        return Grid._from_array(shifted, self._fill_value)
+
+    def animate(
+        self,
+        frames: int,
+        dx: int = 0,
+        dy: int = 0,
+        overlay: Optional['Grid'] = None,
+        wrap: bool = False
+    ) -> List['Grid']:
+        """
+        Build an animation by repeatedly shifting this grid, optionally OR-ing an overlay onto every step.
 
-        for c, r in itertools.product(range(self._width), range(self._height)):
-            src_c = (c + dx) % self._width if wrap else c + dx
-            src_r = (r + dy) % self._height if wrap else r + dy
+        Frame ``n`` is frame ``n - 1`` (this grid for the first) shifted by (dx, dy) as in `get_shifted`, with
+        `overlay` drawn on top. All frames are written into a single preallocated buffer in one pass, and the returned
+        Grids are views into it.
 
-            if 0 <= src_c < self._width and 0 <= src_r < self._height:
-                new[c][r] = self._grid[src_c][src_r]
+        Parameters:
+            frames (int):
+                Number of frames to produce.
 
-        return Grid(width=self._width, height=self._height, fill_value=self._fill_value, init_grid=new)
+            dx (int, optional):
+                Column offset applied at each step. Defaults to 0.
+
+            dy (int, optional):
+                Row offset applied at each step. Defaults to 0.
+
+            overlay (Grid, optional):
+                A grid of the same size drawn over every frame after shifting. Defaults to None.
+
+            wrap (bool, optional):
+                Whether shifts wrap around the edges. Defaults to False.
+
+        Returns:
+            List[Grid]:
+                The frames, in order.
+        """
+        if frames < 0:
+            raise ValueError("frames must be non-negative")
+
+        shape = (self._width, self._height)
+        if overlay is None:
+            overlay_arr = np.zeros((0, 0), dtype=np.uint8)
+        elif (overlay.width, overlay.height) != shape:
+            raise ValueError(f"overlay must be {self._width}×{self._height}")
+        else:
+            overlay_arr = np.ascontiguousarray(overlay.array)
 
-    def __getitem__(self, index: int) -> list[int]:
-        """Allow column-major indexing: grid[col] → list of pixel values down that column."""
-        return self._grid[index]
+        out = np.empty((frames, *shape), dtype=np.uint8)
+
+        if HAS_NUMBA:
+            animate_kernel(np.ascontiguousarray(self._grid), out, dx, dy, wrap, self._fill_value, overlay_arr)
+        else:
+            prev = self._grid
+            for frame in out:
+                _shift_into(prev, frame, dx, dy, wrap, self._fill_value)
+                if overlay_arr.size:
+                    frame |= overlay_arr
+                prev = frame
+
+        return [type(self)._from_array(frame, self._fill_value) for frame in out]
+
+    def __getitem__(self, index: Union[int, Tuple[int, int]]) -> Union[np.ndarray, int]:
+        """
+        Allow column-major indexing: grid[col] → read-only array of pixel values down that column,
+        grid[x, y] → the value of a single pixel (see `get_pixel_value`).
+        """
+        if isinstance(index, tuple):
+            return self.get_pixel_value(*index)
+
+        return self.array[index]
 
     def __len__(self) -> int:
         """Number of columns (i.e. grid width)."""
-        return len(self._grid)
+        return self._width
 
     def __iter__(self):
-        """Iterate over columns."""
-        return iter(self._grid)
+        """Iterate over columns (read-only arrays)."""
+        return iter(self.array)
+
+
+class Grid9x34(Grid):
+    """
+    `Grid` specialised for the 9×34 hardware matrix.
+
+    Pixels are kept as a packed bitmap (see `Grid.bits`) with the shape fixed at class level, so `get_shifted` and
+    `get_pixel_value` are a handful of integer operations. The array form is only unpacked when something asks for it;
+    once it exists it is the authoritative copy and the bitmap is derived from it again.
+    """
+    WIDTH:   ClassVar[int] = MATRIX_WIDTH
+    HEIGHT:  ClassVar[int] = MATRIX_HEIGHT
+    _SIZE:   ClassVar[int] = MATRIX_WIDTH * MATRIX_HEIGHT
+    _NBYTES: ClassVar[int] = (MATRIX_WIDTH * MATRIX_HEIGHT + 7) // 8
+
+    _bits:  Optional[int] = None
+    _array: Optional[np.ndarray] = None
+
+    def __init__(
+        self,
+        width: int = MATRIX_WIDTH,
+        height: int = MATRIX_HEIGHT,
+        fill_value: int = 0,
+        init_grid: Union[List[List[int]], np.ndarray] = None
+    ) -> None:
+        if (width, height) != (self.WIDTH, self.HEIGHT):
+            raise ValueError(f"Grid9x34 must be {self.WIDTH}×{self.HEIGHT}, not {width}×{height}")
+
+        super().__init__(width=width, height=height, fill_value=fill_value, init_grid=init_grid)
+
+    @property
+    def _grid(self) -> np.ndarray:
+        """The pixel array, unpacked from the bitmap on first use."""
+        if self._array is None:
+            raw = np.frombuffer(self._bits.to_bytes(self._NBYTES, 'little'), dtype=np.uint8)
+            self._array = np.unpackbits(raw, count=self._SIZE, bitorder='little').reshape(self.WIDTH, self.HEIGHT)
+        return self._array
+
+    @_grid.setter
+    def _grid(self, arr: np.ndarray) -> None:
+        self._array = arr
+        self._bits = None
+        self._wire_cache = None
+
+    @property
+    def bits(self) -> int:
+        """The packed bitmap; free unless the array form has taken over."""
+        if self._array is None:
+            return self._bits
+        return super().bits
+
+    @classmethod
+    def _from_bits(cls, bits: int, fill_value: int = 0) -> 'Grid9x34':
+        """Wrap a packed 9×34 bitmap without unpacking it."""
+        new = cls.__new__(cls)
+        new._bits = bits
+        new._width, new._height = cls.WIDTH, cls.HEIGHT
+        new._fill_value = fill_value
+        return new
+
+    def get_pixel_value(self, x: int, y: int) -> int:
+        if self._array is not None:
+            return super().get_pixel_value(x, y)
+
+        if not (0 <= x < self.WIDTH and 0 <= y < self.HEIGHT):
+            raise IndexError(f"({x},{y}) out of bounds {self.WIDTH}×{self.HEIGHT}")
+        return (self._bits >> (x * self.HEIGHT + y)) & 1
+
+    def get_shifted(
+        self,
+        dx: int = 0,
+        dy: int = 0,
+        wrap: bool = False
+    ) -> 'Grid9x34':
+        shifted = shift_bits(self.bits, self.WIDTH, self.HEIGHT, dx, dy, wrap, self._fill_value)
+        return self._from_bits(shifted, self._fill_value)
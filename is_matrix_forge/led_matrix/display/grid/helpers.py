@@ -1,15 +1,18 @@
 from __future__ import annotations
 
+import atexit
+import itertools
 import threading
-from typing import Any, List
+from functools import lru_cache
+from typing import Any, Dict, List, Union
 
-from inspyre_toolbox.chrono import sleep as ist_sleep
+import numpy as np
 from serial.tools.list_ports_common import ListPortInfo
 
 from is_matrix_forge.common.helpers import coerce_to_int
 from is_matrix_forge.led_matrix.helpers.device import get_devices
 from is_matrix_forge.led_matrix.constants import HEIGHT, WIDTH
-from is_matrix_forge.led_matrix.display.helpers import render_matrix
+from is_matrix_forge.led_matrix.helpers import disconnect_dev
 from is_matrix_forge.led_matrix.errors import MalformedGridError
 
 
@@ -68,41 +71,262 @@ def generate_blank_grid(
     if fill_value not in (0, 1):
         raise ValueError(f"fill_value must be 0 or 1, not {fill_value}")
 
-    return [
-        [fill_value for _ in range(height)]
-        for _ in range(width)
-    ]
+    # Repeating an int is done in C; each column still gets its own list object.
+    return [[fill_value] * height for _ in range(width)]
 
 
 def is_valid_grid(grid, width, height):
+    """
+    Check that `grid` is a column-major list of `width` lists, each `height` long, holding only 0s and 1s, or a
+    `Grid` of that size.
+
+    The cell check flattens the grid into a bytearray and deletes the 0/1 bytes in C, so a valid grid never has its
+    pixels tested one at a time in Python. Cells a bytearray can't hold (floats, negatives, other objects) are checked
+    individually instead.
+    """
+    if not isinstance(grid, list):
+        # A Grid was validated when it was built; only its size needs checking.
+        from is_matrix_forge.led_matrix.display.grid.grid import Grid
+
+        return isinstance(grid, Grid) and grid.width == width and grid.height == height
 
     # column-major: width columns of height rows each
-    return (
+    if not (
         isinstance(grid, list)
         and len(grid) == width
-        and all(
-            isinstance(col, list)
-            and len(col) == height
-            and all(cell in (0,1) for cell in col)
-            for col in grid
-        )
-    )
+        and all(isinstance(col, list) and len(col) == height for col in grid)
+    ):
+        return False
+
+    try:
+        cells = bytearray(itertools.chain.from_iterable(grid))
+    except (TypeError, ValueError):
+        return all(cell in (0, 1) for col in grid for cell in col)
+
+    return not cells.translate(None, b'\x00\x01')
+
+
+def grid_to_bytes(grid: Union[List[List[int]], np.ndarray, 'Grid']) -> bytes:
+    """
+    Pack a column-major grid into bytes: the canonical key for caching or comparing grids, and the Draw payload.
+
+    Pixel (x, y) is lit when non-zero and lands on bit ``x + width * y``, least-significant bit first, so a 9×34
+    grid packs into the 39 bytes the device expects. Equal grids of equal size always give equal bytes; hashing
+    them is far cheaper than hashing nested tuples of ints.
+
+    Parameters:
+        grid (Union[List[List[int]], np.ndarray, Grid]):
+            The grid to pack. A `Grid` returns its cached `Grid.to_wire` payload.
+
+    Returns:
+        bytes:
+            The packed grid, ``ceil(width * height / 8)`` bytes long.
+    """
+    to_wire = getattr(grid, 'to_wire', None)
+    if to_wire is not None:
+        return to_wire()
+
+    lit = np.asarray(grid) != 0
+    return np.packbits(lit.T.ravel(), bitorder='little').tobytes()
+
+
+@lru_cache(maxsize=256)
+def row_band_mask(width: int, height: int, start: int, stop: int) -> int:
+    """
+    Return a bitmap mask selecting rows ``start`` to ``stop - 1`` of every column.
+
+    The mask uses the packed column-major layout of `shift_bits`, where pixel (x, y) lives at bit
+    ``x * height + y``.
+
+    Parameters:
+        width (int):
+            Number of columns in the grid.
+
+        height (int):
+            Number of rows in the grid.
+
+        start (int):
+            First row (inclusive) to select.
+
+        stop (int):
+            Last row (exclusive) to select.
+
+    Returns:
+        int:
+            The mask.
+    """
+    start, stop = max(0, start), min(height, stop)
+    if start >= stop:
+        return 0
+
+    column = ((1 << (stop - start)) - 1) << start
+    mask = 0
+    for x in range(width):
+        mask |= column << (x * height)
+
+    return mask
+
+
+def shift_bits(
+        bits:       int,
+        width:      int,
+        height:     int,
+        dx:         int  = 0,
+        dy:         int  = 0,
+        wrap:       bool = False,
+        fill_value: int  = 0
+) -> int:
+    """
+    Shift a packed column-major bitmap using whole-integer (SWAR) operations.
+
+    Pixel (x, y) is stored at bit ``x * height + y``, so the whole grid is a single Python int. Pixel (c, r) of the
+    result is read from pixel (c + dx, r + dy) of the source, matching `Grid.get_shifted`.
+
+    Parameters:
+        bits (int):
+            The packed source bitmap.
+
+        width (int):
+            Number of columns in the grid.
+
+        height (int):
+            Number of rows in the grid.
+
+        dx (int):
+            Column offset to read from.
+
+        dy (int):
+            Row offset to read from.
+
+        wrap (bool):
+            Whether pixels shifted off one edge re-enter on the opposite edge.
+
+        fill_value (int):
+            Value (0 or 1) for vacated pixels when not wrapping.
+
+    Returns:
+        int:
+            The shifted bitmap.
+    """
+    size = width * height
+    full = (1 << size) - 1
+
+    if wrap:
+        dy %= height
+        dx %= width
+
+        if dy:
+            low = row_band_mask(width, height, 0, height - dy)
+            bits = ((bits >> dy) & low) | ((bits << (height - dy)) & full & ~low)
+
+        if dx:
+            offset = dx * height
+            bits = ((bits >> offset) | (bits << (size - offset))) & full
+
+        return bits
+
+    if abs(dx) >= width or abs(dy) >= height:
+        return full if fill_value else 0
+
+    if dy > 0:
+        keep = row_band_mask(width, height, 0, height - dy)
+        bits = (bits >> dy) & keep
+    elif dy < 0:
+        keep = row_band_mask(width, height, -dy, height)
+        bits = (bits << -dy) & keep
+    else:
+        keep = full
+
+    if dx > 0:
+        offset = dx * height
+        bits >>= offset
+        keep >>= offset
+    elif dx < 0:
+        offset = -dx * height
+        bits = (bits << offset) & full
+        keep = (keep << offset) & full
 
+    if fill_value:
+        bits |= full & ~keep
 
+    return bits
 
 
-def hold_pattern(dev, grid: List[List[int]], reapply_interval: float = 55.00) -> None:
+class _HoldWriter:
+    """
+    The single writer thread holding a device's display for `hold_pattern`.
+
+    The thread redraws when the held grid is replaced (the `dirty` event) or, failing that, every `interval` seconds
+    to keep the matrix from timing out. Setting `stopped` (see `stop`) ends it straight away, mid-wait.
+    """
+
+    def __init__(self, dev: ListPortInfo, grid: Any, interval: float) -> None:
+        self.dev = dev
+        self.grid = grid
+        self.interval = interval
+        self.dirty = threading.Event()
+        self.dirty.set()  # draw the first grid as soon as the thread starts
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self._run, name=f'hold_pattern[{dev.device}]', daemon=True)
+
+    def update(self, grid: Any, interval: float) -> None:
+        """Swap in a new grid (and interval) and wake the writer to draw it now."""
+        self.grid = grid
+        self.interval = interval
+        self.dirty.set()
+
+    def stop(self) -> None:
+        """Tell the writer to exit, waking it if it is waiting for the next refresh."""
+        self.stopped.set()
+        self.dirty.set()
+
+    def _run(self) -> None:
+        from is_matrix_forge.led_matrix.commands import pooled_port
+        from is_matrix_forge.led_matrix.display.helpers import render_matrix_on
+
+        try:
+            while not self.stopped.is_set():
+                self.dirty.wait(self.interval)
+                if self.stopped.is_set():
+                    break
+
+                self.dirty.clear()
+
+                # Borrow the device's shared connection for each redraw only, so other commands can reach it between.
+                try:
+                    with pooled_port(self.dev) as s:
+                        render_matrix_on(self.dev, s, self.grid)
+                except (IOError, OSError):
+                    # E.g. the matrix was briefly unplugged; keep holding and try again at the next refresh.
+                    disconnect_dev(self.dev.device)
+        finally:
+            with _HOLD_WRITERS_LOCK:
+                # Under the lock, so `hold_pattern` never hands a grid to a writer that is on its way out.
+                self.stopped.set()
+                if _HOLD_WRITERS.get(self.dev.device) is self:
+                    del _HOLD_WRITERS[self.dev.device]
+
+
+_HOLD_WRITERS: Dict[str, _HoldWriter] = {}
+_HOLD_WRITERS_LOCK = threading.Lock()
+
+HOLD_EXIT_TIMEOUT = 2.0
+"""float: Seconds to wait at exit for each `hold_pattern` writer thread to finish."""
+
+
+def hold_pattern(dev, grid: Union[List[List[int]], 'Grid'], reapply_interval: float = 55.00) -> None:
     """
     Hold the state of the LED matrix indefinitely, only updating the display every `reapply_interval` seconds.
 
     This is useful for maintaining a static display on the LED matrix without having a constant refresh/computation
-    load.
+    load. Each device gets one writer thread; calling this again for a device that is already being held replaces
+    the held grid and redraws it straight away instead of starting another thread.
 
     Parameters:
         dev (ListPortInfo):
             The serial com device/port to use.
 
-        grid (List[List[int]])::
+        grid (Union[List[List[int]], Grid]):
             The grid to display on the LED matrix.
 
         reapply_interval (Union[float, int]):
@@ -116,15 +340,51 @@ def hold_pattern(dev, grid: List[List[int]], reapply_interval: float = 55.00) ->
     if not isinstance(dev, ListPortInfo):
         raise TypeError(f"dev must be a ListPortInfo object, not {type(dev)}")
 
-    if not isinstance(grid, list) or not is_valid_grid(grid, 9, 34):
+    if not is_valid_grid(grid, 9, 34):
         raise MalformedGridError(f"grid must be a 9x34 list of 0/1, not {type(grid)}")
 
-    def worker(interval):
-        global running
-        running.state = True
-        while running:
-            ist_sleep(interval)
-            render_matrix(dev, grid)
+    if not isinstance(grid, list):
+        grid = grid.array
+
+    with _HOLD_WRITERS_LOCK:
+        writer = _HOLD_WRITERS.get(dev.device)
+        if writer is not None and writer.thread.is_alive() and not writer.stopped.is_set():
+            writer.update(grid, reapply_interval)
+            return
+
+        # Start it before letting go of the lock; until then it isn't alive, and a concurrent call would start another.
+        writer = _HOLD_WRITERS[dev.device] = _HoldWriter(dev, grid, reapply_interval)
+        writer.thread.start()
+
+
+def release_hold(dev: ListPortInfo = None, timeout: float = None) -> None:
+    """
+    Stop holding a device's display (see `hold_pattern`), or every held device's.
+
+    The writer threads exit as soon as they're told to, even mid-way through a `reapply_interval` wait. Called
+    automatically at exit, waiting at most `HOLD_EXIT_TIMEOUT` seconds per writer.
+
+    Parameters:
+        dev (ListPortInfo, optional):
+            The device to release. Defaults to all of them.
+
+        timeout (float, optional):
+            Seconds to wait for each writer thread to finish. Defaults to waiting until it has.
+    """
+    with _HOLD_WRITERS_LOCK:
+        if dev is None:
+            writers = list(_HOLD_WRITERS.values())
+        else:
+            writers = [w for w in (_HOLD_WRITERS.get(dev.device),) if w is not None]
+
+    for writer in writers:
+        writer.stop()
+
+    for writer in writers:
+        if writer.thread is not threading.current_thread():
+            writer.thread.join(timeout)
+
 
-    thread = threading.Thread(target=worker, args=(reapply_interval,), daemon=True)
-    thread.start()
+# A writer stuck on a wedged device must not hang interpreter shutdown; its writes time out (see `pooled_port`),
+# but don't wait on it for longer than this either way.
+atexit.register(lambda: release_hold(timeout=HOLD_EXIT_TIMEOUT))
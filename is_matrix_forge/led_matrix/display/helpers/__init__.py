@@ -1,7 +1,23 @@
 import time
 import math
+
+import numpy as np
+
 from is_matrix_forge.led_matrix.commands.map import CommandVals
 from is_matrix_forge.led_matrix.commands import send_command
+from is_matrix_forge.led_matrix.constants import FWK_MAGIC, HEIGHT, WIDTH
+from is_matrix_forge.led_matrix.helpers import is_showing, send_serial
+from is_matrix_forge.led_matrix.display.grid._kernels import HAS_NUMBA, pack_kernel
+
+
+_BREATHE_STEPS = 256
+"""int: Number of brightness steps in one breath cycle of `_BREATHE_LUT`."""
+
+_BREATHE_LUT = tuple(
+    int(round(100 * 0.5 * (1 - math.cos(2 * math.pi * k / _BREATHE_STEPS))))
+    for k in range(_BREATHE_STEPS)
+)
+"""tuple[int, ...]: One raised-cosine breath (0→100→0 percent), sampled `_BREATHE_STEPS` times."""
 
 
 def keep_image(
@@ -27,19 +43,24 @@ def keep_image(
                                  (or between redraws if not breathing)
     """
     base_brightness = controller.brightness
-    t = 0.0
-    period = 1.0  # one full sine cycle = 1 second
-    step = 1.0 / breathe_fps
+
+    # Scale the breath table to this image's brightness once, rather than on every step.
+    levels = tuple(base_brightness * pct // 100 for pct in _BREATHE_LUT)
+
+    # Steps are scheduled against absolute monotonic deadlines, so the time spent sending commands doesn't
+    # accumulate as drift; one full breath cycle = 1 second.
+    start = deadline = time.monotonic()
 
     while controller.keep_image:
         if breathe:
-            # Compute a smooth sine-based oscillation from 0→1→0
-            phase = (t % period) / period            # 0.0→1.0
-            fade = 0.5 * (1 - math.cos(2 * math.pi * phase))
-            bri = int(round(base_brightness * fade))
-            controller.set_brightness(bri)
-            time.sleep(interval)
-            t += interval
+            controller.set_brightness(levels[int((deadline - start) * _BREATHE_STEPS) % _BREATHE_STEPS])
+            deadline += interval
+            delay = deadline - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                # Fell behind (e.g. a slow write); resume from now rather than bursting to catch up.
+                deadline = time.monotonic()
         else:
             # just hold at base brightness
             controller.set_brightness(base_brightness)
@@ -55,56 +76,77 @@ def keep_image(
 
 
 def light_leds(dev, leds):
-    """Light a specific number of LEDs"""
+    """Light a specific number of LEDs (clamped to the 0..306 the matrix has)"""
+    # Keep the payload at 39 bytes whatever is asked for
+    leds = max(0, min(int(leds), WIDTH * HEIGHT))
+
     # Initialize a byte array with all LEDs off
-    vals = [0x00 for _ in range(39)]
+    vals = bytearray(39)
 
     # Calculate how many complete bytes we need to fill (each byte = 8 LEDs)
     complete_bytes = int(leds / 8)
 
     # Set all complete bytes to 0xFF (all 8 bits on)
-    for byte in range(complete_bytes):
-        vals[byte] = 0xFF
+    vals[:complete_bytes] = b'\xff' * complete_bytes
 
     # Handle the remaining LEDs (less than 8) in the last partial byte
     remaining_leds = leds % 8
 
-    # For each remaining LED, set the corresponding bit in the last byte
-    # This creates a binary pattern like 00011111 for 5 remaining LEDs
-    for i in range(remaining_leds):
-        vals[complete_bytes] += 1 << i
+    # Set the low `remaining_leds` bits of the last byte, e.g. 00011111 for 5 remaining LEDs
+    if remaining_leds:
+        vals[complete_bytes] = (1 << remaining_leds) - 1
 
     # Send the command to the device to display the pattern
     send_command(dev, CommandVals.Draw, vals)
 
 
-def render_matrix(dev, matrix):
+def pack_matrix(matrix) -> bytes:
+    """
+    Pack a 9x34 column-major matrix into the 39-byte Draw payload; any non-zero value lights its pixel.
+
+    Only the 9x34 area the device has is used. A 9x34 `Grid` hands over its cached `Grid.to_wire` payload.
+    """
+    if getattr(matrix, 'to_wire', None) is not None and (matrix.width, matrix.height) == (9, 34):
+        return matrix.to_wire()
+
+    arr = np.asarray(matrix)
+    # The kernel doesn't bounds-check, so only hand it arrays covering the whole 9x34 area.
+    if HAS_NUMBA and arr.ndim == 2 and arr.shape[0] >= 9 and arr.shape[1] >= 34:
+        return pack_kernel(arr, 9, 34).tobytes()
+
+    lit = arr[:9, :34] != 0
+
+    # The device reads pixel (x, y) from bit i = x + 9 * y, least-significant bit first, so pack the row-major
+    # (transposed) view. 306 pixels pack into 39 bytes, the last one zero-padded.
+    return np.packbits(lit.T.ravel(), bitorder='little').tobytes()
+
+
+def render_matrix(dev, matrix, force: bool = False):
     """Show a black/white matrix
-    Send everything in a single command"""
-    # Initialize a byte array to hold the binary representation of the matrix
-    # 39 bytes = 312 bits, which is enough for 9x34 = 306 pixels
-    vals = [0x00 for _ in range(39)]
-
-    # Iterate through each position in the 9x34 matrix
-    for x in range(9):
-        for y in range(34):
-            # Convert 2D coordinates to a linear index
-            # The matrix is stored in column-major order (y changes faster than x)
-            i = x + 9 * y
-
-            # If the pixel at this position is "on" (non-zero)
-            if matrix[x][y]:
-                # Calculate which byte in the vals array this pixel belongs to
-                byte_index = int(i / 8)
-
-                # Calculate which bit within that byte represents this pixel
-                bit_position = i % 8
-
-                # Set the corresponding bit in the appropriate byte
-                # This efficiently packs 8 pixels into each byte
-                vals[byte_index] = vals[byte_index] | (1 << bit_position)
-
-    # Send the packed binary data to the device
-    send_command(dev, CommandVals.Draw, vals)
+    Send everything in a single command
+
+    Nothing is sent when the device is already showing this exact frame (no other command has been sent to it since
+    it was drawn, less than `DRAW_KEEPALIVE` seconds ago), unless `force` is set.
+    """
+    payload = pack_matrix(matrix)
+    if not force and is_showing(dev.device, payload):
+        return
 
+    send_command(dev, CommandVals.Draw, payload)
 
+
+def render_matrix_on(dev, s, matrix):
+    """
+    Like `render_matrix`, but write to an already-open serial connection instead of opening a new one.
+
+    Parameters:
+        dev (ListPortInfo):
+            The device being written to.
+
+        s (serial.Serial):
+            An open serial connection to `dev`.
+
+        matrix:
+            The 9x34 column-major matrix to show.
+    """
+    send_serial(dev, s, bytes(FWK_MAGIC + [CommandVals.Draw]) + pack_matrix(matrix))
@@ -15,8 +15,11 @@ Description:
     $DESCRIPTION
 
 """
+from typing import Iterable, Sequence, Union
+
 from is_matrix_forge.led_matrix.commands.map import CommandVals
-from is_matrix_forge.led_matrix.constants import FWK_MAGIC
+from is_matrix_forge.led_matrix.constants import FWK_MAGIC, HEIGHT
+from is_matrix_forge.led_matrix.helpers import send_serial
 
 
 def send_col(dev, s, x, vals):
@@ -28,6 +31,49 @@ def send_col(dev, s, x, vals):
 def commit_cols(dev, s):
     """Commit the changes from sending individual cols with send_col(), displaying the matrix.
     This makes sure that the matrix isn't partially updated."""
-    from ..hardware import FWK_MAGIC
     command = FWK_MAGIC + [CommandVals.DrawGreyColBuffer, 0x00]
     send_serial(dev, s, command)
+
+
+def build_cols_batch(cols_vals: Iterable[Sequence[int]]) -> bytes:
+    """
+    Build the single buffer `send_cols_batch` writes: a StageGreyCol command per column, then the commit.
+
+    Parameters:
+        cols_vals (Iterable[Sequence[int]]):
+            The brightness values (0-255) for each column, starting at column 0. Values past the matrix height are
+            dropped so they can't be read as the start of the next command.
+
+    Returns:
+        bytes:
+            The concatenated commands.
+    """
+    buf = bytearray()
+    for x, vals in enumerate(cols_vals):
+        buf += bytes(FWK_MAGIC + [CommandVals.StageGreyCol, x])
+        buf += bytes(vals[:HEIGHT])
+
+    buf += bytes(FWK_MAGIC + [CommandVals.DrawGreyColBuffer, 0x00])
+    return bytes(buf)
+
+
+def send_cols_batch(dev, s, cols_vals: Union[bytes, Iterable[Sequence[int]]]) -> None:
+    """
+    Stage greyscale values for every column and commit them, all in a single serial write.
+
+    Equivalent to calling `send_col` for each column followed by `commit_cols`, but the commands are concatenated
+    into one buffer, so the whole frame costs one write instead of one per column plus one for the commit.
+
+    Parameters:
+        dev (ListPortInfo):
+            The device being written to.
+
+        s (serial.Serial):
+            An open serial connection to `dev`.
+
+        cols_vals (Union[bytes, Iterable[Sequence[int]]]):
+            The brightness values (0-255) for each column, starting at column 0, or a buffer already built by
+            `build_cols_batch`.
+    """
+    buf = cols_vals if isinstance(cols_vals, bytes) else build_cols_batch(cols_vals)
+    send_serial(dev, s, buf)
@@ -5,7 +5,6 @@ This module provides functions for displaying images and videos on the LED matri
 It includes functions for rendering images, playing videos, and capturing from a camera.
 """
 
-import serial
 import time
 import cv2
 from PIL import Image
@@ -13,7 +12,7 @@ from PIL import Image
 from ..constants import WIDTH, HEIGHT
 from ..hardware import send_serial
 from ..commands.map import CommandVals
-from ..commands import send_command
+from ..commands import pooled_port, send_command
 from . import send_col, commit_cols
 from is_matrix_forge.led_matrix.helpers.status_handler import get_status, set_status
 
@@ -78,7 +77,7 @@ def image_greyscale(dev, image_file):
     """Display an image in greyscale
     Sends each 1x34 column and then commits => 10 commands
     """
-    with serial.Serial(dev.device, 115200) as s:
+    with pooled_port(dev) as s:
         from PIL import Image
 
         im = Image.open(image_file).convert("RGB")
@@ -99,33 +98,34 @@ def image_greyscale(dev, image_file):
 def camera(dev):
     """Play a live view from the webcam, for fun"""
     set_status('camera')
-    with serial.Serial(dev.device, 115200) as s:
-        import cv2
+    import cv2
 
-        capture = cv2.VideoCapture(1)
-        ret, frame = capture.read()
+    capture = cv2.VideoCapture(1)
+    ret, frame = capture.read()
 
-        scale_y = HEIGHT / frame.shape[0]
+    scale_y = HEIGHT / frame.shape[0]
 
-        # Scale the video to 34 pixels height
-        dim = (HEIGHT, int(round(frame.shape[1] * scale_y)))
-        # Find the starting position to crop the width to be centered
-        # For very narrow videos, make sure to stay in bounds
-        start_x = max(0, int(round(dim[1] / 2 - WIDTH / 2)))
-        end_x = min(dim[1], start_x + WIDTH)
+    # Scale the video to 34 pixels height
+    dim = (HEIGHT, int(round(frame.shape[1] * scale_y)))
+    # Find the starting position to crop the width to be centered
+    # For very narrow videos, make sure to stay in bounds
+    start_x = max(0, int(round(dim[1] / 2 - WIDTH / 2)))
+    end_x = min(dim[1], start_x + WIDTH)
 
-        # Pre-process the video into resized, cropped, grayscale frames
-        while get_status() == 'camera':
-            ret, frame = capture.read()
-            if not ret:
-                print("Failed to capture video frames")
-                break
+    # Pre-process the video into resized, cropped, grayscale frames
+    while get_status() == 'camera':
+        ret, frame = capture.read()
+        if not ret:
+            print("Failed to capture video frames")
+            break
 
-            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
 
-            resized = cv2.resize(gray, (dim[1], dim[0]))
-            cropped = resized[0:HEIGHT, start_x:end_x]
+        resized = cv2.resize(gray, (dim[1], dim[0]))
+        cropped = resized[0:HEIGHT, start_x:end_x]
 
+        # Borrow the shared connection per frame, so other commands can still reach the device between frames.
+        with pooled_port(dev) as s:
             for x in range(0, cropped.shape[1]):
                 vals = [0 for _ in range(HEIGHT)]
 
@@ -139,52 +139,52 @@ def camera(dev):
 def video(dev, video_file):
     """Resize and play back a video"""
     set_status('video')
-    with serial.Serial(dev.device, 115200) as s:
-        import cv2
+    import cv2
 
-        capture = cv2.VideoCapture(video_file)
-        ret, frame = capture.read()
+    capture = cv2.VideoCapture(video_file)
+    ret, frame = capture.read()
+
+    scale_y = HEIGHT / frame.shape[0]
 
-        scale_y = HEIGHT / frame.shape[0]
-
-        # Scale the video to 34 pixels height
-        dim = (HEIGHT, int(round(frame.shape[1] * scale_y)))
-        # Find the starting position to crop the width to be centered
-        # For very narrow videos, make sure to stay in bounds
-        start_x = max(0, int(round(dim[1] / 2 - WIDTH / 2)))
-        end_x = min(dim[1], start_x + WIDTH)
-
-        processed = []
-
-        # Pre-process the video into resized, cropped, grayscale frames
-        while get_status() == 'video':
-            ret, frame = capture.read()
-            if not ret:
-                print("Failed to read video frames")
-                break
-
-            gray = cv2.cvtColor(frame, cv2.COLOR_RGB2GRAY)
-
-            resized = cv2.resize(gray, (dim[1], dim[0]))
-            cropped = resized[0:HEIGHT, start_x:end_x]
-
-            processed.append(cropped)
-
-        # Determine frame delay based on the video's FPS.  Fall back to 30 FPS
-        # if the FPS value cannot be obtained.
-        fps = capture.get(cv2.CAP_PROP_FPS)
-        try:
-            fps = float(fps)
-            if fps <= 0 or fps != fps:
-                raise ValueError
-        except Exception:
-            fps = 30.0
-        frame_delay = 1.0 / fps
-
-        # Write it out to the module one frame at a time while respecting the
-        # original frame rate.
-        for frame in processed:
-            start = time.time()
+    # Scale the video to 34 pixels height
+    dim = (HEIGHT, int(round(frame.shape[1] * scale_y)))
+    # Find the starting position to crop the width to be centered
+    # For very narrow videos, make sure to stay in bounds
+    start_x = max(0, int(round(dim[1] / 2 - WIDTH / 2)))
+    end_x = min(dim[1], start_x + WIDTH)
+
+    processed = []
+
+    # Pre-process the video into resized, cropped, grayscale frames
+    while get_status() == 'video':
+        ret, frame = capture.read()
+        if not ret:
+            print("Failed to read video frames")
+            break
+
+        gray = cv2.cvtColor(frame, cv2.COLOR_RGB2GRAY)
+
+        resized = cv2.resize(gray, (dim[1], dim[0]))
+        cropped = resized[0:HEIGHT, start_x:end_x]
+
+        processed.append(cropped)
+
+    # Determine frame delay based on the video's FPS.  Fall back to 30 FPS
+    # if the FPS value cannot be obtained.
+    fps = capture.get(cv2.CAP_PROP_FPS)
+    try:
+        fps = float(fps)
+        if fps <= 0 or fps != fps:
+            raise ValueError
+    except Exception:
+        fps = 30.0
+    frame_delay = 1.0 / fps
+
+    # Write it out to the module one frame at a time while respecting the
+    # original frame rate.
+    for frame in processed:
+        start = time.time()
+        with pooled_port(dev) as s:
             for x in range(0, cropped.shape[1]):
                 vals = [0 for _ in range(HEIGHT)]
 
@@ -194,6 +194,6 @@ def video(dev, video_file):
                 send_col(dev, s, x, vals)
             commit_cols(dev, s)
 
-            elapsed = time.time() - start
-            if frame_delay > elapsed:
-                time.sleep(frame_delay - elapsed)
+        elapsed = time.time() - start
+        if frame_delay > elapsed:
+            time.sleep(frame_delay - elapsed)
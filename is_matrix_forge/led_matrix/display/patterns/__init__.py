@@ -7,52 +7,48 @@ It includes functions for displaying checkerboards, gradients, and other visual
 
 import time
 
+import numpy as np
+
 from .built_in.stencils import every_nth_row, every_nth_col
 from ..helpers import render_matrix
 from is_matrix_forge.led_matrix.display.patterns.built_in.stencils import every_nth_row, every_nth_col
 from is_matrix_forge.led_matrix.display.helpers.columns import send_col
+from is_matrix_forge.led_matrix.hardware import brightness
+from is_matrix_forge.led_matrix.helpers.status_handler import set_status, get_status
+
+
+# One breath as (brightness, delay before sending it). Bright ranges appear similar, so they are stepped through
+# quickly: 250→50 fast, 50→0 slow, 0→50 slow, 50→250 fast.
+_BREATHE_FRAMES = (
+    tuple((250 - i * 20, 0.03) for i in range(10))
+    + tuple((50 - i * 5, 0.06) for i in range(10))
+    + tuple((i * 5, 0.06) for i in range(10))
+    + tuple((50 + i * 20, 0.03) for i in range(10))
+)
 
 
 def breathing(dev):
     """Animate breathing brightness.
     Keeps currently displayed grid"""
     set_status('breathing')
-    # Bright ranges appear similar, so we have to go through those faster
     while get_status() == 'breathing':
-        # Go quickly from 250 to 50
-        for i in range(10):
-            time.sleep(0.03)
-            brightness(dev, 250 - i * 20)
-
-        # Go slowly from 50 to 0
-        for i in range(10):
-            time.sleep(0.06)
-            brightness(dev, 50 - i * 5)
-
-        # Go slowly from 0 to 50
-        for i in range(10):
-            time.sleep(0.06)
-            brightness(dev, i * 5)
-
-        # Go quickly from 50 to 250
-        for i in range(10):
-            time.sleep(0.03)
-            brightness(dev, 50 + i * 20)
+        for level, delay in _BREATHE_FRAMES:
+            time.sleep(delay)
+            brightness(dev, level)
 
 
 def eq(dev, vals):
     """Display 9 values in equalizer diagram starting from the middle, going up and down"""
-    matrix = [[0 for _ in range(34)] for _ in range(9)]
+    matrix = np.zeros((9, 34), dtype=np.uint8)
+    row = 34 // 2
 
     for col, val in enumerate(vals[:9]):
-        row = int(34 / 2)
         above = int(val / 2)
         below = val - above
 
-        for i in range(above):
-            matrix[col][row + i] = 0xFF
-        for i in range(below):
-            matrix[col][row - 1 - i] = 0xFF
+        # Light `above` pixels from the middle row down and `below` pixels above it
+        matrix[col, row:row + above] = 0xFF
+        matrix[col, max(0, row - below):row] = 0xFF
 
     render_matrix(dev, matrix)
 
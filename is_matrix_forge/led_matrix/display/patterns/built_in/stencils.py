@@ -15,56 +15,80 @@ Description:
     $DESCRIPTION
 
 """
-import serial
+from functools import lru_cache
 
+from is_matrix_forge.led_matrix.commands import pooled_port
 from is_matrix_forge.led_matrix.constants import WIDTH, HEIGHT
-from is_matrix_forge.led_matrix.display.helpers.columns import send_col, commit_cols
+from is_matrix_forge.led_matrix.display.helpers.columns import build_cols_batch, send_cols_batch
 
 
-def all_brightnesses(dev):
-    """Increase the brightness with each pixel.
-    Only 0-255 available, so it can't fill all 306 LEDs"""
-    with serial.Serial(dev.device, 115200) as s:
-        for x in range(0, WIDTH):
-            vals = [0 for _ in range(HEIGHT)]
+def _write_frame(dev, frame: bytes) -> None:
+    with pooled_port(dev) as s:
+        send_cols_batch(dev, s, frame)
 
-            for y in range(HEIGHT):
-                brightness = x + WIDTH * y
-                if brightness > 255:
-                    vals[y] = 0
-                else:
-                    vals[y] = brightness
 
-            send_col(dev, s, x, vals)
-        commit_cols(dev, s)
+# Each stencil only depends on its arguments, so its whole command buffer is built once per argument and reused.
 
+@lru_cache(maxsize=None)
+def _all_brightnesses_frame() -> bytes:
+    cols = []
+    for x in range(0, WIDTH):
+        vals = [0 for _ in range(HEIGHT)]
 
+        for y in range(HEIGHT):
+            brightness = x + WIDTH * y
+            if brightness > 255:
+                vals[y] = 0
+            else:
+                vals[y] = brightness
 
-def every_nth_row(dev, n):
-    with serial.Serial(dev.device, 115200) as s:
-        for x in range(0, WIDTH):
-            vals = [(0xFF if y % n == 0 else 0) for y in range(HEIGHT)]
+        cols.append(vals)
 
-            send_col(dev, s, x, vals)
-        commit_cols(dev, s)
+    return build_cols_batch(cols)
 
 
-def every_nth_col(dev, n):
-    with serial.Serial(dev.device, 115200) as s:
-        for x in range(0, WIDTH):
-            vals = [(0xFF if x % n == 0 else 0) for _ in range(HEIGHT)]
+@lru_cache(maxsize=None)
+def _every_nth_row_frame(n: int) -> bytes:
+    # Every column is the same
+    vals = [(0xFF if y % n == 0 else 0) for y in range(HEIGHT)]
+    return build_cols_batch([vals] * WIDTH)
+
+
+@lru_cache(maxsize=None)
+def _every_nth_col_frame(n: int) -> bytes:
+    lit, dark = [0xFF] * HEIGHT, [0x00] * HEIGHT
+    return build_cols_batch([(lit if x % n == 0 else dark) for x in range(0, WIDTH)])
+
+
+@lru_cache(maxsize=None)
+def _checkerboard_frame(n: int) -> bytes:
+    # Columns only come in two phases
+    base = (([0xFF] * n) + ([0x00] * n)) * int(HEIGHT / 2)
+    rotated = base[n:] + base[:n]
+    return build_cols_batch([(rotated if x % (n * 2) < n else base) for x in range(0, WIDTH)])
+
+
+# The sizes offered by the built-in pattern menu are ready at import.
+for _n in range(2, 7):
+    _every_nth_row_frame(_n)
+for _n in range(2, 6):
+    _every_nth_col_frame(_n)
+del _n
 
-            send_col(dev, s, x, vals)
-        commit_cols(dev, s)
+
+def all_brightnesses(dev):
+    """Increase the brightness with each pixel.
+    Only 0-255 available, so it can't fill all 306 LEDs"""
+    _write_frame(dev, _all_brightnesses_frame())
+
+
+def every_nth_row(dev, n):
+    _write_frame(dev, _every_nth_row_frame(n))
+
+
+def every_nth_col(dev, n):
+    _write_frame(dev, _every_nth_col_frame(n))
 
 
 def checkerboard(dev, n):
-    with serial.Serial(dev.device, 115200) as s:
-        for x in range(0, WIDTH):
-            vals = (([0xFF] * n) + ([0x00] * n)) * int(HEIGHT / 2)
-            if x % (n * 2) < n:
-                # Rotate once
-                vals = vals[n:] + vals[:n]
-
-            send_col(dev, s, x, vals)
-        commit_cols(dev, s)
+    _write_frame(dev, _checkerboard_frame(n))
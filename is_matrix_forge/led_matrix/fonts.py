@@ -1,12 +1,18 @@
-from typing import List
+from functools import lru_cache
+from typing import List, Sequence
 import json
 import importlib.resources
 
 from is_matrix_forge.assets.font_map import FontMap
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Load the default font map shipped with the package using importlib.resources
-with importlib.resources.open_text("is_matrix_forge.assets", "char_map.json", encoding="utf-8") as f:
-    _FONT_DATA = json.load(f)
+_FONT_BYTES = importlib.resources.files("is_matrix_forge.assets").joinpath("char_map.json").read_bytes()
+_FONT_DATA = orjson.loads(_FONT_BYTES) if orjson is not None else json.loads(_FONT_BYTES)
 FONT_MAP = FontMap(font_map=_FONT_DATA)
 
 
@@ -18,3 +24,29 @@ def convert_font(ch: str) -> List[int]:
 def convert_symbol(symbol: str) -> List[int]:
     """Return the glyph list for a named symbol."""
     return FONT_MAP.lookup(symbol, kind="symbol")
+
+
+def glyph_mask(pixels: Sequence[int]) -> int:
+    """
+    Pack a 5x6 glyph (row-major, 30 values) into Draw-payload bits for the top character slot.
+
+    The glyph is drawn at columns 2-6, so pixel (x, y) lands on bit ``(2 + x) + 9 * y``; shift the result left by
+    ``63 * n`` (seven 9-pixel rows) to place it in slot ``n``.
+    """
+    mask = 0
+    for i, value in enumerate(pixels[:30]):
+        if value:
+            mask |= 1 << (2 + i % 5 + 9 * (i // 5))
+    return mask
+
+
+@lru_cache(maxsize=None)
+def font_mask(ch: str) -> int:
+    """`glyph_mask` of `convert_font(ch)`, computed once per character (call ``cache_clear`` after reloading)."""
+    return glyph_mask(convert_font(ch))
+
+
+@lru_cache(maxsize=None)
+def symbol_mask(symbol: str) -> int:
+    """`glyph_mask` of `convert_symbol(symbol)`, computed once per symbol (call ``cache_clear`` after reloading)."""
+    return glyph_mask(convert_symbol(symbol))
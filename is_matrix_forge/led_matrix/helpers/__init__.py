@@ -4,16 +4,55 @@ from inspyre_toolbox.path_man import provision_path
 
 from serial.tools.list_ports_common import ListPortInfo
 from threading import Thread
+from time import monotonic
 
 import json
 from pathlib import Path
-from typing import Union, Optional, List, Any, ByteString
+from typing import Union, Optional, List, Any, ByteString, Dict, Tuple
+
+from is_matrix_forge.led_matrix.constants import DISCONNECTED_DEVS
+
+try:
+    import orjson
+except ImportError:  # Optional speed-up (`pip install led-matrix-battery[fast_json]`).
+    orjson = None
+
+
+LAST_DRAW: Dict[str, Tuple[bytes, float]] = {}
+"""dict[str, tuple[bytes, float]]: The Draw payload each device (by port) is showing, and the `time.monotonic()` it was
+sent at, for as long as nothing else was written to it."""
+
+DRAW_KEEPALIVE = 50.0
+"""float: Seconds after which an unchanged frame is sent again anyway; the matrix sleeps after 60 seconds without
+commands, and a reset device may no longer be showing it."""
+
+
+def record_draw(port: str, payload: bytes) -> None:
+    """Remember that `payload` was just drawn on the device at `port`."""
+    LAST_DRAW[port] = (bytes(payload), monotonic())
+
+
+def is_showing(port: str, payload: bytes) -> bool:
+    """
+    Check whether the device at `port` is already showing `payload`, drawn recently enough not to need a resend.
+
+    Args:
+        port (str): The device's port.
+        payload (bytes): The Draw payload about to be sent.
+
+    Returns:
+        bool: True if sending `payload` again can be skipped.
+    """
+    last = LAST_DRAW.get(port)
+    return last is not None and last[0] == payload and monotonic() - last[1] < DRAW_KEEPALIVE
 
 
 def get_json_from_file(path: Union[str, Path]) -> Any:
     """
     Load and parse a JSON file.
 
+    Uses `orjson` when it is installed, falling back to the standard library's `json`.
+
     Args:
         path (Union[str, Path]): The path to the JSON file to load.
 
@@ -28,7 +67,7 @@ def get_json_from_file(path: Union[str, Path]) -> Any:
             If the path points to a directory.
 
         json.JSONDecodeError:
-            If the file contains invalid JSON.
+            If the file contains invalid JSON (`orjson`'s error is a subclass).
     """
     path = provision_path(path)
     if not path.exists():
@@ -37,6 +76,9 @@ def get_json_from_file(path: Union[str, Path]) -> Any:
     if not path.is_file():
         raise IsADirectoryError(f'Preset file is a directory: {path}')
 
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+
     with open(path, 'r') as f:
         return json.load(f)
 
@@ -79,13 +121,13 @@ def load_from_file(
     frames = []
     for entry in data:
 
-        if not isinstance(entry, dict) and isinstance(entry, list) and is_valid_grid(entry, width, height):
-            entry = migrate_frame(entry, fallback_duration)
-            entry['duration'] = fallback_duration or .33
+        # Bare grids (old-style files) are wrapped into frame dicts; frame dicts and anything else pass through.
+        if isinstance(entry, list) and is_valid_grid(entry, width, height):
+            entry = migrate_frame(entry, fallback_duration or .33)
 
         frames.append(entry)
 
-    return data
+    return frames
 
 
 def disconnect_dev(dev: str) -> None:
@@ -118,6 +160,8 @@ def send_serial(dev: ListPortInfo, s: 'serial.Serial', command: ByteString) -> N
     Raises:
         IOError, OSError: If there is an error communicating with the device.
     """
+    # Whatever this writes, the device may no longer be showing the last Draw frame.
+    LAST_DRAW.pop(dev.device, None)
     try:
         s.write(command)
     except (IOError, OSError) as _ex:
@@ -125,6 +169,24 @@ def send_serial(dev: ListPortInfo, s: 'serial.Serial', command: ByteString) -> N
         # print("Error: ", ex)
 
 
+def enable_low_latency(s) -> bool:
+    """
+    Ask the serial driver to deliver small writes immediately (Linux ``ASYNC_LOW_LATENCY``).
+
+    Args:
+        s (serial.Serial): The open serial connection.
+
+    Returns:
+        bool: Whether low-latency mode was enabled; it isn't available on every platform or driver.
+    """
+    try:
+        s.set_low_latency_mode(True)
+    except (AttributeError, NotImplementedError, OSError, ValueError):
+        return False
+
+    return True
+
+
 def identify_devices(devices: Optional[List[ListPortInfo]] = None) -> None:
     """
     Identify LED matrix devices by flashing an identification message on each
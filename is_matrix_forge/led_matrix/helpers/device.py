@@ -4,6 +4,9 @@ Device helper functions for LED matrix hardware.
 This module provides utility functions for working with LED matrix devices,
 including functions to convert between different device location formats.
 """
+import time
+from typing import Dict, Tuple
+
 from serial import Serial, SerialException
 from serial.tools import list_ports
 from is_matrix_forge.log_engine import ROOT_LOGGER
@@ -11,6 +14,17 @@ from is_matrix_forge.log_engine import ROOT_LOGGER
 
 MOD_LOGGER = ROOT_LOGGER.get_child('led_matrix.helpers.device')
 
+EXPECTED_VID = 0x32AC
+"""int: USB vendor ID of the LED matrix input module."""
+
+EXPECTED_PID = 0x20
+"""int: USB product ID of the LED matrix input module."""
+
+CHECK_DEVICE_TTL = 10.0
+"""float: Seconds a successful `check_device` result is reused before the device is probed again."""
+
+_CHECK_DEVICE_CACHE: Dict[Tuple, float] = {}
+
 
 def serial_loc_to_physical(dev):
     """
@@ -70,7 +84,19 @@ def check_device(device):
         )
         return False
 
-    return bool(test_connection(device.device))
+    # Probing opens the port, so a recent success is reused; failures are always re-checked.
+    key = (device.device, device.vid, device.pid, device.serial_number)
+    checked_at = _CHECK_DEVICE_CACHE.get(key)
+    if checked_at is not None and time.monotonic() - checked_at < CHECK_DEVICE_TTL:
+        log.debug('Device passed a check recently; skipping the connection test.')
+        return True
+
+    if not test_connection(device.device):
+        _CHECK_DEVICE_CACHE.pop(key, None)
+        return False
+
+    _CHECK_DEVICE_CACHE[key] = time.monotonic()
+    return True
 
 
 def get_devices():
@@ -83,7 +109,7 @@ def get_devices():
     log.debug(f'Found {len(ports)} devices.')
     log.debug('Filtering and returning devices...')
     return [
-        port for port in ports if port.vid == 0x32AC and port.pid == 0x20
+        port for port in ports if port.vid == EXPECTED_VID and port.pid == EXPECTED_PID
     ]
 
 
@@ -101,8 +127,11 @@ def test_connection(port_name):
     log = MOD_LOGGER.get_child('test_connection')
     log.debug(f'Testing connection to {port_name}...')
 
+    from is_matrix_forge.led_matrix.commands import exclusive_port
+
     try:
-        with Serial(port_name, 115200) as s:
+        # Don't open a second connection alongside the pooled one.
+        with exclusive_port(port_name), Serial(port_name, 115200) as s:
             s.write(b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00')
             s.flush()
             log.debug('Connection test successful.')
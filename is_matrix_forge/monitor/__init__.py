@@ -53,6 +53,8 @@ def run_power_monitor(
             The filepath to the sound to play when the device is unplugged from power.
 
     """
+    from is_matrix_forge.monitor.monitor import PowerMonitor
+
     monitor = PowerMonitor(
         device,
         battery_check_interval=battery_check_interval,
@@ -66,3 +68,42 @@ def run_power_monitor(
         monitor.stop(without_salutation=True)
 
     return monitor
+
+
+def run_power_monitor_threaded(
+        device:                 ListPortInfo,
+        battery_check_interval: int = 5,
+        plugged_alert:          Optional[Union[str, Path]] = DEFAULT_PLUGGED_SOUND,
+        unplugged_alert:        Optional[Union[str, Path]] = DEFAULT_UNPLUGGED_SOUND,
+) -> 'PowerMonitor':
+    """
+    Run the power monitor in a background (daemon) thread.
+
+    Parameters:
+        device (ListPortInfo):
+            The LED matrix on which to display the battery level.
+
+        battery_check_interval (Optional[Union[int, float, str]]):
+            The interval (in seconds) at which to check the battery level.
+
+        plugged_alert (Optional[Union[str, Path]]):
+            The filepath to the sound to play when the device is plugged into power.
+
+        unplugged_alert (Optional[Union[str, Path]]):
+            The filepath to the sound to play when the device is unplugged from power.
+
+    Returns:
+        PowerMonitor:
+            The running monitor; its `thread` is running the monitor loop, and `stop` ends it.
+    """
+    from is_matrix_forge.monitor.monitor import PowerMonitor
+
+    monitor = PowerMonitor(
+        device,
+        battery_check_interval=battery_check_interval,
+        plugged_alert=plugged_alert,
+        unplugged_alert=unplugged_alert
+    )
+    monitor.start(threaded=True)
+
+    return monitor
@@ -1,6 +1,8 @@
+import time
+
+from is_matrix_forge.led_matrix.helpers import DRAW_KEEPALIVE
 from is_matrix_forge.log_engine import ROOT_LOGGER
 from is_matrix_forge.monitor.monitor import PowerMonitor
-from is_matrix_forge.monitor.helpers import get_battery_percentage
 
 MOD_LOGGER = ROOT_LOGGER.get_child('monitor.events')
 
@@ -45,18 +47,39 @@ def __handle_device_plugged_in(power_monitor):
     pm = power_monitor
     if pm.plugged_in and not pm.controller.is_animating and (not pm.last_state or pm.last_state is None):
         pm.notify('plugged')
-        pm.controller.clear()
+        # `_dev_lock` is held for the matrix writes only; `stop` takes it too, but must never wait on a sound. Once
+        # `stop` has had it, the monitor is no longer running and the matrix is left to its goodbye.
+        with pm._dev_lock:
+            if pm.running:
+                pm.controller.clear()
         pm._last_state = True
+        pm._last_percent = None
 
 
 def __handle_device_unplugged(power_monitor):
     pm = power_monitor
     if pm.unplugged and not pm.controller.is_animating and (pm.last_state or pm.last_state is None):
         pm.notify('unplugged')
-        pm.controller.clear()
+        with pm._dev_lock:
+            if pm.running:
+                pm.controller.clear()
         pm._last_state = False
-
-    pm.controller.draw_percentage(get_battery_percentage())
+        pm._last_percent = None
+
+    batt = pm._sample_battery()
+    if batt is None:
+        # No reading this cycle; keep showing the last percentage.
+        return
+
+    # Only talk to the matrix when the shown percentage would actually change, or it would otherwise go to sleep.
+    percent = int(batt.percent)
+    now = time.monotonic()
+    if percent != pm._last_percent or pm._last_draw_at is None or now - pm._last_draw_at >= DRAW_KEEPALIVE:
+        with pm._dev_lock:
+            if pm.running:
+                pm.controller.draw_percentage(percent)
+        pm._last_percent = percent
+        pm._last_draw_at = now
 
 
 def handle_event(event: str, power_monitor: PowerMonitor):
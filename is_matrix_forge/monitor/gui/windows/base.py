@@ -3,7 +3,6 @@ from ..layout.base import Layout
 from ..errors import MalformedWindowError
 from ..event import EventCollection
 from ..metaclasses import SingletonABCMeta
-import PySimpleGUI as psg
 
 
 class WindowBase(metaclass=SingletonABCMeta):
@@ -261,13 +260,16 @@ class WindowBase(metaclass=SingletonABCMeta):
             self.layout.rebuild()
 
     def build(self):
+        import PySimpleGUI as psg
+
         if self.built:
             raise RuntimeError('Window already built.')
         self.LAYOUT.build()
         self._layout = self.LAYOUT.layout
         self.__window = psg.Window(self.title, layout=self.layout, finalize=True)
         if getattr(self, '__post_build__', None):
-            print('post_build')
+            self.__post_build__()
+
     def build_event_handlers(self):
         if not self.EVENT_COLLECTION.events:
             raise RuntimeError('No event handlers found to build!')
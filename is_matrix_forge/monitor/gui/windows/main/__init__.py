@@ -3,7 +3,6 @@ from ..base import WindowBase
 from is_matrix_forge.led_matrix.hardware import brightness
 from is_matrix_forge.led_matrix.helpers.device import DEVICES
 from is_matrix_forge.monitor.monitor import PowerMonitor
-import time
 
 
 POWER_MONITOR = PowerMonitor(DEVICES[0])
@@ -14,7 +13,25 @@ class MainWindow(WindowBase):
     Main window for the LED Matrix Battery Monitor GUI.
     """
     DEFAULT_TITLE = 'LED Matrix Battery Monitor'
-    LAYOUT        = MainWindowLayout()
+    _LAYOUT       = None
+
+    @classmethod
+    def get_layout(cls) -> MainWindowLayout:
+        """
+        Get the window's layout, creating it on first use rather than when the class is defined.
+
+        Returns:
+            MainWindowLayout:
+                The layout shared by every `MainWindow`.
+        """
+        if cls._LAYOUT is None:
+            cls._LAYOUT = MainWindowLayout()
+
+        return cls._LAYOUT
+
+    @property
+    def LAYOUT(self) -> MainWindowLayout:
+        return self.get_layout()
 
     def __init__(
             self,
@@ -26,11 +43,9 @@ class MainWindow(WindowBase):
         super().__init__(*args, **kwargs)
 
     def __post_build__(self):
+        # Releasing the slider raises 'BRIGHTNESS_SLIDER' + '_DONE' (the second argument is a key suffix).
         slider_elem = self.window.find_element('BRIGHTNESS_SLIDER')
-        slider_elem.bind(
-            '<ButtonRelease-1>',
-            lambda event, s=slider_elem: self.window.write_event_value('BRIGHTNESS_SLIDER_DONE', s.get())
-        )
+        slider_elem.bind('<ButtonRelease-1>', '_DONE')
 
     def build_event_handlers(self):
         self.EVENT_COLLECTION.create_event(None, self.stop)
@@ -42,12 +57,9 @@ class MainWindow(WindowBase):
             self.stop()
             return
 
-        if event == 'BRIGHTNESS_SLIDER':
-            brightness(DEVICES[0], int(values.get('BRIGHTNESS_SLIDER', 0)))
-            return
-
+        # Mid-drag slider events are ignored; the device is only told once the slider is released.
         if event == 'BRIGHTNESS_SLIDER_DONE':
-            brightness(DEVICES[0], int(values.get('BRIGHTNESS_SLIDER_DONE', 0)))
+            brightness(DEVICES[0], int(values.get('BRIGHTNESS_SLIDER', 0)))
 
     def run(self):
         if not self.built:
@@ -56,20 +68,9 @@ class MainWindow(WindowBase):
         if not self.running:
             raise RuntimeError('Window is not running. Call start() first.')
 
-        DEBOUNCE_DELAY = 0.3
-        last_change = 0
-        pending_value = None
-
         while self.running:
-            event, values = self.window.read(timeout=100)
-
-            if event == 'BRIGHTNESS_SLIDER':
-                pending_value = int(values['BRIGHTNESS_SLIDER'])
-                last_change = time.time()
-
-            if pending_value is not None and time.time() - last_change > DEBOUNCE_DELAY:
-                brightness(DEVICES[0], pending_value)
-                pending_value = None
+            # Nothing here is time-driven, so the timeout only bounds how long a stop can go unnoticed.
+            event, values = self.window.read(timeout=500)
 
             self.handle_event(event, values)
 
@@ -1,4 +1,5 @@
-import PySimpleGUI as psg
+from functools import cached_property
+
 from is_matrix_forge.monitor.gui.layout.base import Layout as BaseLayout
 
 
@@ -9,13 +10,16 @@ MOD_LOGGER = PARENT_LOGGER.get_child('monitor.gui.windows.main.layout')
 
 
 class Layout(BaseLayout):
-    @property
+    @cached_property
     def BLUEPRINT(self):
+        # Imported here so that importing the GUI package doesn't pull in PySimpleGUI/tkinter until a window is built.
+        import PySimpleGUI as psg
+
         return [
 
             [psg.Text('Brightness'), psg.Slider((0, 255), key='BRIGHTNESS_SLIDER', enable_events=True)],
             [psg.Button('Animate'), psg.Checkbox('Animated', key='ANIMATED_CHKBOX'),
              psg.Button('Exit', key='EXIT_BTTN')],
 
-        ].copy()
+        ]
 
@@ -31,20 +31,19 @@ def get_plugged_status(battery_info: Optional[psutil._common.sbattery] = None) -
         - :func:`psutil.sensors_battery`
         - :exc:`BatteryStateUnknownError`
     """
-    if battery_info is not None:
-        if not isinstance(battery_info, psutil._common.sbattery):
-            raise TypeError('Expected a `psutil._common.sbattery` instance')
-    else:
-        from psutil import sensors_battery
-        battery_info = sensors_battery()
-    if not isinstance(battery_info, psutil._common.sbattery):
+    if battery_info is None:
+        try:
+            battery_info = get_battery_info()
+        except Exception as e:
+            raise BatteryStateUnknownError('Could not determine whether the system is plugged in or not due to an ' \
+                                           f'error: {e}') from e
+
+        if battery_info is None:
+            raise BatteryStateUnknownError('No battery was found.')
+    elif not isinstance(battery_info, psutil._common.sbattery):
         raise TypeError('Expected a `psutil._common.sbattery` instance')
 
-    try:
-        battery_info = battery_info or get_battery_info()
-    except Exception as e:
-        raise BatteryStateUnknownError('Could not determine whether the system is plugged in or not due to an ' \
-                                       f'error: {e}') from e
+    return battery_info.power_plugged
 
 
 def check_plugged_in():
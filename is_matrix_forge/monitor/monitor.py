@@ -1,22 +1,22 @@
 
 import time
 from pathlib import Path
-from threading import Thread
-from time import sleep
+from threading import Event, Lock, Thread, current_thread
 from typing import Optional, Union
 
 from inspy_logger import Loggable
-from inspyre_toolbox.syntactic_sweets.classes import validate_type
 from serial.tools.list_ports_common import ListPortInfo
 
 from is_matrix_forge.common.helpers import percentage_to_value
-from is_matrix_forge.led_matrix import pattern, get_animate, animate, percentage, LEDMatrixController
+from is_matrix_forge.led_matrix.controller.controller import LEDMatrixController
+from is_matrix_forge.led_matrix.hardware import animate, get_animate
 from is_matrix_forge.led_matrix.display.animations import goodbye_animation
 from is_matrix_forge.led_matrix.helpers.device import check_device
 from is_matrix_forge.monitor import DEFAULT_PLUGGED_SOUND, DEFAULT_UNPLUGGED_SOUND, MOD_LOGGER, get_plugged_status, \
     PowerMonitorNotRunningError, ECH
 from is_matrix_forge.notify.sounds import Sound
-from is_matrix_forge.monitor.helpers import get_battery_percentage
+from is_matrix_forge.monitor.errors import BatteryStateUnknownError
+from is_matrix_forge.monitor.helpers import get_battery_info
 
 
 class PowerMonitor(Loggable):
@@ -39,12 +39,17 @@ class PowerMonitor(Loggable):
         self.__battery_check_interval = None
         self.__dev                    = None
         self._last_state             = None
+        self._last_percent           = None
+        self._last_draw_at           = None
         self.__plugged_alert          = None
         self.__start_time             = None
         self.__stop_time              = None
         self.__thread                 = None
         self.__unplugged_alert        = None
         self.__controller             = None
+        self._batt_cache              = (0.0, None)
+        self._stop_evt                = Event()
+        self._dev_lock                = Lock()
 
         self.set_device(device)
 
@@ -57,7 +62,7 @@ class PowerMonitor(Loggable):
             self.unplugged_alert = unplugged_alert
 
         self.dev.brightness = percentage_to_value(5)
-        self.__battery_check_interval = battery_check_interval or self.DEFAULT_CHECK_INTERVAL
+        self.battery_check_interval = battery_check_interval or self.DEFAULT_CHECK_INTERVAL
 
     @property
     def battery_check_interval(self):
@@ -69,10 +74,11 @@ class PowerMonitor(Loggable):
         return self.__battery_check_interval
 
     @battery_check_interval.setter
-    @validate_type(int, str, float, preferred_type=float, conversion_funcs=[float])
     def battery_check_interval(self, new):
+        if not isinstance(new, (int, float, str)):
+            raise TypeError(f'battery_check_interval must be of type `int`, `float` or `str`, not {type(new)}')
 
-        self.__battery_check_interval = new
+        self.__battery_check_interval = float(new)
 
     @property
     def controller(self):
@@ -111,7 +117,6 @@ class PowerMonitor(Loggable):
     def plugged_alert(self) -> Sound:
         return self.__plugged_alert or DEFAULT_PLUGGED_SOUND
 
-    @validate_type(Sound)
     @plugged_alert.setter
     def plugged_alert(self, new):
         if not isinstance(new, Sound):
@@ -137,8 +142,18 @@ class PowerMonitor(Loggable):
 
                 False;
                     The device is currently unplugged from power.
+
+            If the battery can't be read right now, the last known state is returned.
+
+        Raises:
+            BatteryStateUnknownError:
+                If the battery can't be read and there is no last known state.
         """
-        return get_plugged_status()
+        batt = self._sample_battery()
+        if batt is None and self._last_state is not None:
+            return self._last_state
+
+        return get_plugged_status(batt)
 
     @property
     def running(self):
@@ -192,14 +207,27 @@ class PowerMonitor(Loggable):
             float:
                 The run time in seconds.
         """
-        if not hasattr(self, 'start_time'):
+        if self.start_time is None:
             raise PowerMonitorNotRunningError('Monitor hasn\'t even been started yet!')
 
-        recent = self.stop_time if hasattr(self, 'stop_time') else time.time()
+        recent = self.stop_time if self.stop_time is not None else time.monotonic()
         return recent - self.start_time
 
     @property
     def start_time(self) -> Optional[float]:
+        """
+        (**Read-only property**)
+
+        When the monitor was last started, as a `time.monotonic` reading (only meaningful relative to `stop_time` or
+        another monotonic reading; see `run_time`).
+
+        Returns:
+            Optional[float]:
+                The `time.monotonic` reading taken when the monitor was last started.
+
+                `None`;
+                    The monitor hasn't been started yet
+        """
         return self.__start_time
 
     @property
@@ -207,14 +235,14 @@ class PowerMonitor(Loggable):
         """
         (**Read-only property**)
 
-        The time the monitor was last stopped.
+        When the monitor was last stopped, as a `time.monotonic` reading.
 
         Returns:
             Optional[float]:
-                The time the monitor was last stopped.
+                The `time.monotonic` reading taken when the monitor was last stopped.
 
                 `None`;
-                    The monitor hasn't been stopped yet
+                    The monitor hasn't been stopped since it was last started
 
         """
         return self.__stop_time
@@ -267,7 +295,6 @@ class PowerMonitor(Loggable):
 
         return self.__unplugged_alert
 
-    @validate_type()
     @unplugged_alert.setter
     def unplugged_alert(self, new):
         """
@@ -285,6 +312,27 @@ class PowerMonitor(Loggable):
 
         self.__unplugged_alert = new
 
+    def _sample_battery(self):
+        """
+        Read the battery state, reusing the last reading if it is less than half a check interval old.
+
+        The main loop, `plugged_in`/`unplugged` and the event handlers all need the battery state each cycle; this
+        lets them share one `psutil.sensors_battery` call instead of making one each.
+
+        Returns:
+            Optional[psutil._common.sbattery]:
+                The battery state, or `None` if the system has no battery (this isn't cached).
+        """
+        sampled_at, batt = self._batt_cache
+        now = time.monotonic()
+
+        if batt is None or now - sampled_at >= (self.battery_check_interval or self.DEFAULT_CHECK_INTERVAL) * 0.5:
+            batt = get_battery_info()
+            if batt is not None:
+                self._batt_cache = (now, batt)
+
+        return batt
+
     def notify(self, which: str):
         """
         Notify the user of a power event (plugged, unplugged).
@@ -332,18 +380,24 @@ class PowerMonitor(Loggable):
         log.debug('Running monitor...')
 
         while self.running:
-            
-            state = 'plugged' if self.plugged_in else 'unplugged'
-            handle_event(state, self)
-
-            if not self.running:
-                self.controller.clear()
+            batt = self._sample_battery()
+            if batt is None:
+                log.error('No battery found; skipping this check.')
+            else:
+                state = 'plugged' if batt.power_plugged else 'unplugged'
+
+                try:
+                    handle_event(state, self)
+                except BatteryStateUnknownError:
+                    # The battery went away mid-cycle; leave the matrix as it is and try again next cycle.
+                    log.warning('Battery state unknown; skipping this check.')
+
+                self.__cycles += 1
+
+            # `stop` sets the event, which ends the wait (and the loop) straight away.
+            if self._stop_evt.wait(self.battery_check_interval):
                 break
 
-            self.__cycles += 1
-
-            sleep(self.battery_check_interval)
-
     def set_device(self, device):
 
         if isinstance(device, LEDMatrixController):
@@ -356,7 +410,7 @@ class PowerMonitor(Loggable):
             raise ValueError(f'device {device} is not available')
 
         self.__dev = device
-        self.__controller = LEDMatrixController(self.dev)
+        self.__controller = LEDMatrixController(device)
 
     def start(self, threaded=False):
         """
@@ -379,14 +433,17 @@ class PowerMonitor(Loggable):
             log.warning('Monitor is already running')
             raise RuntimeError('Monitor is already running')
 
+        self._stop_evt.clear()
         self._running = True
         log.debug('Set running to True')
-        self.__start_time = time.time()
+        self.__start_time = time.monotonic()
+        self.__stop_time = None
 
         if threaded:
-            t = Thread(target=self.run, daemon=True)
-            t.start()
+            self.__thread = Thread(target=self.run, name='PowerMonitor', daemon=True)
+            self.__thread.start()
             ECH.register_handler(self.stop, kwargs={'reason': 'Program exited.'})
+            return self.__thread
 
         try:
             self.run()
@@ -410,22 +467,30 @@ class PowerMonitor(Loggable):
             raise PowerMonitorNotRunningError("Can't call stop() on a monitor that is not running")
         else:
             log.debug('Stopping monitor...')
-        self.__stop_time = time.time()
+        self.__stop_time = time.monotonic()
         self.running = False
+        self._stop_evt.set()
         log.debug('"running" flag set to False...waiting for thread to finish')
 
+        # The loop wakes as soon as the event is set; let it finish its cycle before the matrix is reset below.
+        if self.__thread is not None and self.__thread is not current_thread():
+            self.__thread.join(self.battery_check_interval)
+
         if reason:
             log.info(f'Stopping monitor due to: {reason}')
         else:
             log.info('Stopping monitor. With no reason.')
 
-        if not without_salutation:
-            goodbye_animation(self.dev)
-        else:
-            log.debug('Skipping goodbye salutation...')
+        # If the loop is still mid-cycle (the join above timed out), don't interleave with its writes.
+        with self._dev_lock:
+            if not without_salutation:
+                goodbye_animation(self.dev)
+            else:
+                log.debug('Skipping goodbye salutation...')
 
-        if get_animate(self.dev):
-            animate(self.dev, False)
+            if get_animate(self.dev):
+                animate(self.dev, False)
 
-        log.debug('Clearing LED matrix...')
-        self.controller.clear()
+            log.debug('Clearing LED matrix...')
+            self.controller.clear()
+            self._last_percent = None
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 """LED matrix aware progress bars."""
 
-from typing import Optional, Any, Iterable, List
+from typing import Optional, Any, Dict, Iterable, List, Tuple
 
 from tqdm import tqdm as _tqdm
 
@@ -13,11 +13,9 @@ except Exception:  # pragma: no cover - dependency issues
     DEVICES = []
     LEDMatrixController = None  # type: ignore
 
-# Global cache of controller instances so multiple bars can share controllers
-if 'LEDMatrixController' in globals() and LEDMatrixController is not None:
-    _CONTROLLERS: List[Optional[LEDMatrixController]] = [None for _ in range(len(DEVICES))]
-else:  # pragma: no cover - when dependencies missing
-    _CONTROLLERS = []  # type: ignore[var-annotated]
+# Global cache of controllers so multiple bars can share them: device index -> (device, controller). A controller
+# that failed to initialise is cached as None, so later bars don't retry it until the device at that index changes.
+_CONTROLLERS: Dict[int, Tuple[Any, Optional[Any]]] = {}
 
 # Track how many LEDTqdm bars are active to rotate matrices
 _ACTIVE_BARS: List['LEDTqdm'] = []
@@ -28,6 +26,8 @@ class LEDTqdm(_tqdm):
 
     def __init__(self, *args: Any, use_led: bool = True, matrix: Optional[Any] = None,
                  **kwargs: Any) -> None:
+        # Range of ``n`` that still shows the last drawn percentage; empty until the first draw.
+        self._tick_lo = self._tick_hi = 0
         super().__init__(*args, **kwargs)
 
         self._matrix = None
@@ -47,13 +47,16 @@ class LEDTqdm(_tqdm):
     def _get_controller(index: int):
         if LEDMatrixController is None or index >= len(DEVICES):  # pragma: no cover - hardware missing
             return None
-        ctrl = _CONTROLLERS[index]
-        if ctrl is None:
-            try:
-                ctrl = LEDMatrixController(DEVICES[index], 100)
-            except Exception:
-                ctrl = None
-            _CONTROLLERS[index] = ctrl
+        device = DEVICES[index]
+        cached = _CONTROLLERS.get(index)
+        if cached is not None and cached[0] is device:
+            return cached[1]
+
+        try:
+            ctrl = LEDMatrixController(device, 100)
+        except Exception:
+            ctrl = None
+        _CONTROLLERS[index] = (device, ctrl)
         return ctrl
 
     @classmethod
@@ -70,7 +73,13 @@ class LEDTqdm(_tqdm):
     def _render_led(self) -> None:
         if not self._matrix or not self.total:
             return
-        percent = int(self.n / self.total * 100)
+        total = self.total
+        percent = int(self.n * 100 // total)
+
+        # Every n in [lo, hi) shows this same percentage, so `update` needn't come back here until n leaves it.
+        self._tick_lo = -(-percent * total // 100)
+        self._tick_hi = -(-(percent + 1) * total // 100)
+
         if percent != self._last_percent:
             try:
                 self._matrix.draw_percentage(percent)
@@ -81,7 +90,8 @@ class LEDTqdm(_tqdm):
 
     def update(self, n: int = 1) -> None:  # type: ignore[override]
         super().update(n)
-        self._render_led()
+        if not self._tick_lo <= self.n < self._tick_hi:
+            self._render_led()
 
     def close(self) -> None:
         super().close()
@@ -0,0 +1,120 @@
+# tests/test_commands.py
+
+import threading
+
+import pytest
+
+from serial.tools.list_ports_common import ListPortInfo
+
+import is_matrix_forge.led_matrix.commands as commands_mod
+from is_matrix_forge.led_matrix.constants import DISCONNECTED_DEVS
+
+
+PORT = "/dev/ttyACM0"
+
+
+class FakeSerial:
+    opened = []
+
+    def __init__(self, port, baudrate, **kwargs):
+        self.port = port
+        self.kwargs = kwargs
+        self.is_open = True
+        self.written = []
+        FakeSerial.opened.append(self)
+
+    def write(self, data):
+        self.written.append(bytes(data))
+
+    def close(self):
+        self.is_open = False
+
+
+@pytest.fixture(autouse=True)
+def patch_serial(monkeypatch):
+    # No matrix is attached while testing; every "connection" is a FakeSerial
+    FakeSerial.opened = []
+    monkeypatch.setattr(commands_mod.serial, "Serial", FakeSerial)
+    monkeypatch.setattr(commands_mod, "enable_low_latency", lambda s: False)
+    commands_mod._PORT_POOL.clear()
+    DISCONNECTED_DEVS.clear()
+    yield
+    commands_mod._PORT_POOL.clear()
+    DISCONNECTED_DEVS.clear()
+
+
+@pytest.fixture
+def dev():
+    return ListPortInfo(PORT)
+
+
+def test_pooled_port_reuses_connection(dev):
+    # Act
+    with commands_mod.pooled_port(dev) as first:
+        pass
+    with commands_mod.pooled_port(dev) as second:
+        pass
+
+    # Assert
+    assert first is second
+    assert len(FakeSerial.opened) == 1
+    assert first.kwargs["timeout"] == commands_mod.READ_TIMEOUT
+    assert first.kwargs["write_timeout"] == commands_mod.WRITE_TIMEOUT
+
+
+def test_pooled_port_drops_connection_on_io_error(dev):
+    # Act
+    with pytest.raises(OSError):
+        with commands_mod.pooled_port(dev) as first:
+            raise OSError("device went away")
+    with commands_mod.pooled_port(dev) as second:
+        pass
+
+    # Assert
+    assert not first.is_open
+    assert second is not first
+    assert len(FakeSerial.opened) == 2
+
+
+def test_pooled_port_recovers_from_transient_disconnect(dev):
+    # Arrange
+    with commands_mod.pooled_port(dev) as first:
+        commands_mod.disconnect_dev(PORT)
+
+    # Act
+    with commands_mod.pooled_port(dev) as second:
+        pass
+    with commands_mod.pooled_port(dev) as third:
+        pass
+
+    # Assert
+    assert not first.is_open
+    assert second is not first
+    assert third is second
+    assert PORT not in DISCONNECTED_DEVS
+
+
+def test_close_ports_skips_port_it_cannot_lock(dev, monkeypatch):
+    # Arrange
+    monkeypatch.setattr(commands_mod, "WRITE_TIMEOUT", 0.05)
+    monkeypatch.setattr(commands_mod, "READ_TIMEOUT", 0.05)
+    borrowed, release = threading.Event(), threading.Event()
+
+    def stuck_borrower():
+        with commands_mod.pooled_port(dev):
+            borrowed.set()
+            release.wait(5)
+
+    thread = threading.Thread(target=stuck_borrower, daemon=True)
+    thread.start()
+    borrowed.wait(5)
+
+    # Act
+    commands_mod.close_ports()
+
+    # Assert
+    assert FakeSerial.opened[0].is_open
+    release.set()
+    thread.join(5)
+    commands_mod.close_ports()
+    assert not FakeSerial.opened[0].is_open
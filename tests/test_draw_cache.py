@@ -0,0 +1,157 @@
+# tests/test_draw_cache.py
+
+import pytest
+from unittest.mock import Mock
+
+from serial.tools.list_ports_common import ListPortInfo
+
+import is_matrix_forge.led_matrix.commands as commands_mod
+import is_matrix_forge.led_matrix.display.helpers as display_helpers_mod
+import is_matrix_forge.led_matrix.helpers as helpers_mod
+from is_matrix_forge.led_matrix.commands.map import CommandVals
+from is_matrix_forge.led_matrix.constants import DISCONNECTED_DEVS, FWK_MAGIC
+from is_matrix_forge.led_matrix.helpers import DRAW_KEEPALIVE, LAST_DRAW, is_showing, record_draw
+
+
+PORT = "/dev/ttyACM0"
+PAYLOAD = bytes(range(39))
+
+
+class FakeSerial:
+    def __init__(self, port=None, baudrate=None, **kwargs):
+        self.is_open = True
+        self.written = []
+
+    def write(self, data):
+        self.written.append(bytes(data))
+
+    def reset_input_buffer(self):
+        pass
+
+    def read(self, size):
+        return bytes(size)
+
+    def close(self):
+        self.is_open = False
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture(autouse=True)
+def clean_state(monkeypatch):
+    # No matrix is attached while testing; every "connection" is a FakeSerial
+    monkeypatch.setattr(commands_mod.serial, "Serial", FakeSerial)
+    monkeypatch.setattr(commands_mod, "enable_low_latency", lambda s: False)
+    commands_mod._PORT_POOL.clear()
+    DISCONNECTED_DEVS.clear()
+    LAST_DRAW.clear()
+    yield
+    commands_mod._PORT_POOL.clear()
+    DISCONNECTED_DEVS.clear()
+    LAST_DRAW.clear()
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(helpers_mod, "monotonic", clock)
+    return clock
+
+
+@pytest.fixture
+def dev():
+    return ListPortInfo(PORT)
+
+
+def test_is_showing_after_record_draw(clock):
+    # Act
+    record_draw(PORT, PAYLOAD)
+
+    # Assert
+    assert is_showing(PORT, PAYLOAD)
+    assert not is_showing(PORT, bytes(39))
+    assert not is_showing("/dev/ttyACM1", PAYLOAD)
+
+
+@pytest.mark.parametrize(
+    "elapsed,expected",
+    [
+        (DRAW_KEEPALIVE - 1, True),
+        (DRAW_KEEPALIVE, False),
+        (DRAW_KEEPALIVE + 1, False),
+    ],
+    ids=["within_window", "at_window", "past_window"]
+)
+def test_is_showing_expires_after_keepalive(clock, elapsed, expected):
+    # Arrange
+    record_draw(PORT, PAYLOAD)
+
+    # Act
+    clock.now += elapsed
+
+    # Assert
+    assert is_showing(PORT, PAYLOAD) is expected
+
+
+def test_send_serial_clears_last_draw(dev):
+    # Arrange
+    record_draw(PORT, PAYLOAD)
+
+    # Act
+    helpers_mod.send_serial(dev, FakeSerial(), b"\x00")
+
+    # Assert
+    assert PORT not in LAST_DRAW
+
+
+def test_send_command_records_draw_and_non_draw_clears_it(dev):
+    # Act
+    commands_mod.send_command(dev, CommandVals.Draw, PAYLOAD)
+    recorded = is_showing(PORT, PAYLOAD)
+    commands_mod.send_command(dev, CommandVals.Brightness, [50])
+
+    # Assert
+    assert recorded
+    assert PORT not in LAST_DRAW
+
+
+@pytest.mark.parametrize(
+    "force,expected_sends",
+    [
+        (False, 0),
+        (True, 1),
+    ],
+    ids=["unchanged_skipped", "forced"]
+)
+def test_render_matrix_skips_unchanged_frame_unless_forced(dev, monkeypatch, force, expected_sends):
+    # Arrange
+    matrix = [[0] * 34 for _ in range(9)]
+    record_draw(PORT, display_helpers_mod.pack_matrix(matrix))
+    send_command = Mock()
+    monkeypatch.setattr(display_helpers_mod, "send_command", send_command)
+
+    # Act
+    display_helpers_mod.render_matrix(dev, matrix, force=force)
+
+    # Assert
+    assert send_command.call_count == expected_sends
+
+
+def test_render_matrix_writes_draw_command(dev):
+    # Arrange
+    matrix = [[0] * 34 for _ in range(9)]
+    matrix[0][0] = 1
+
+    # Act
+    display_helpers_mod.render_matrix(dev, matrix)
+
+    # Assert
+    written = commands_mod._PORT_POOL[PORT].written
+    assert written == [bytes(FWK_MAGIC + [CommandVals.Draw]) + display_helpers_mod.pack_matrix(matrix)]
+    assert is_showing(PORT, display_helpers_mod.pack_matrix(matrix))
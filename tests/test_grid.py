@@ -1,5 +1,6 @@
 # tests/test_grid.py
 
+import numpy as np
 import pytest
 from unittest.mock import Mock
 
@@ -165,6 +166,16 @@ def test_from_spec_happy():
     # Assert
     assert grid.grid == spec
 
+@pytest.mark.parametrize(
+    "spec",
+    [[], [[1, 0], [0]], [[1, 2], [0, 1]]],
+    ids=["empty", "ragged", "non_binary"]
+)
+def test_from_spec_invalid(spec):
+    # Act & Assert
+    with pytest.raises(ValueError):
+        Grid.from_spec(spec)
+
 @pytest.mark.parametrize(
     "raw,frame_number,expected_grid",
     [
@@ -314,3 +325,235 @@ def test_get_shifted(init_grid, dx, dy, wrap, expected):
     assert shifted.width == grid.width
     assert shifted.height == grid.height
     assert shifted.fill_value == grid.fill_value
+
+@pytest.mark.parametrize(
+    "dx,dy,wrap,fill_value",
+    [
+        (0, 1, False, 0),
+        (0, -2, False, 1),
+        (1, 0, False, 0),
+        (-1, 3, True, 0),
+        (2, -1, True, 1),
+    ],
+    ids=["down_no_wrap", "up_no_wrap_fill1", "right_no_wrap", "left_down_wrap", "right_up_wrap"]
+)
+def test_shift_bits_matches_get_shifted(dx, dy, wrap, fill_value):
+    from is_matrix_forge.led_matrix.display.grid.helpers import shift_bits
+
+    # Arrange
+    init_grid = [[(x * 7 + y * 3) % 2 for y in range(5)] for x in range(3)]
+    grid = Grid(width=3, height=5, fill_value=fill_value, init_grid=init_grid)
+
+    # Act
+    bits = shift_bits(grid.bits, 3, 5, dx=dx, dy=dy, wrap=wrap, fill_value=fill_value)
+
+    # Assert
+    assert Grid.from_bits(grid.bits, width=3, height=5).grid == init_grid
+    assert Grid.from_bits(bits, width=3, height=5).grid == grid.get_shifted(dx=dx, dy=dy, wrap=wrap).grid
+
+def test_load_frames_happy(monkeypatch):
+    # Arrange
+    raw = [{"grid": [[1, 1], [0, 0]]}, {"grid": [[0, 0], [1, 1]]}]
+    monkeypatch.setattr(grid_mod, "load_from_file", lambda filename: raw)
+
+    # Act
+    frames = Grid.load_frames("dummy.json", width=2, height=2)
+
+    # Assert
+    assert [frame.grid for frame in frames] == [[[1, 1], [0, 0]], [[0, 0], [1, 1]]]
+
+
+def test_from_preset_resolves_by_stem(monkeypatch, tmp_path):
+    # Arrange
+    (tmp_path / "diag.json").write_text("[[1, 0], [0, 1]]")
+    (tmp_path / "manifest.json").write_text("{}")
+    monkeypatch.setattr(grid_mod, "PRESETS_DIR", tmp_path)
+    monkeypatch.setattr(Grid, "_preset_dir_mtime", None)
+    monkeypatch.setattr(grid_mod, "load_from_file", lambda filename: [[1, 0], [0, 1]])
+
+    # Act
+    names = Grid.list_presets()
+    grid = Grid.from_preset("diag", width=2, height=2)
+
+    # Assert
+    assert names == ["diag"]
+    assert grid.grid == [[1, 0], [0, 1]]
+    with pytest.raises(FileNotFoundError):
+        Grid.from_preset("missing", width=2, height=2)
+
+
+@pytest.mark.parametrize(
+    "value,valid",
+    [
+        (np.array([[1, 0], [0, 1]], dtype=np.uint8), True),
+        (np.array([[True, False], [False, True]]), True),
+        (np.array([[1, 2], [0, 1]]), False),
+        (np.zeros((2, 3), dtype=np.uint8), False),
+    ],
+    ids=["uint8", "bool", "bad_value", "bad_shape"]
+)
+def test_init_from_array(value, valid):
+    # Act / Assert
+    if valid:
+        assert Grid(width=2, height=2, init_grid=value).grid == value.astype(int).tolist()
+    else:
+        with pytest.raises(ValueError):
+            Grid(width=2, height=2, init_grid=value)
+
+
+@pytest.mark.parametrize("wrap", [False, True], ids=["fill", "wrap"])
+def test_get_shifted_kernel_matches_numpy_path(monkeypatch, wrap):
+    # Arrange
+    rng = np.random.default_rng(0)
+    grid = Grid(width=5, height=4, init_grid=rng.integers(0, 2, (5, 4), dtype=np.uint8))
+    offsets = [(dx, dy) for dx in range(-6, 7) for dy in range(-5, 6)]
+
+    # Act
+    monkeypatch.setattr(grid_mod, "HAS_NUMBA", True)
+    with_kernel = [grid.get_shifted(dx, dy, wrap).grid for dx, dy in offsets]
+    monkeypatch.setattr(grid_mod, "HAS_NUMBA", False)
+    with_numpy = [grid.get_shifted(dx, dy, wrap).grid for dx, dy in offsets]
+
+    # Assert
+    assert with_kernel == with_numpy
+
+
+def test_array_is_read_only_view():
+    # Arrange
+    grid = Grid(width=2, height=2, init_grid=[[1, 0], [0, 1]])
+
+    # Act
+    view = grid.array
+
+    # Assert
+    assert view.tolist() == grid.to_list() == [[1, 0], [0, 1]]
+    with pytest.raises(ValueError):
+        view[0, 0] = 0
+
+
+def test_getitem_pixel_tuple():
+    # Arrange
+    grid = Grid(width=2, height=3, init_grid=[[1, 0, 0], [0, 0, 1]])
+
+    # Act / Assert
+    assert grid[1, 2] == 1
+    assert grid[0, 2] == 0
+    with pytest.raises(IndexError, match="out of bounds"):
+        grid[2, 0]
+
+
+def test_from_file_default_size_is_grid9x34(monkeypatch):
+    # Arrange
+    rng = np.random.default_rng(0)
+    data = rng.integers(0, 2, (MATRIX_WIDTH, MATRIX_HEIGHT)).tolist()
+    monkeypatch.setattr(grid_mod, "load_from_file", lambda filename: data)
+    reference = Grid(init_grid=data)
+
+    # Act
+    grid = Grid.from_file("dummy.json")
+    shifted = grid.get_shifted(dx=2, dy=-5, wrap=True)
+
+    # Assert
+    assert isinstance(grid, grid_mod.Grid9x34)
+    assert grid.grid == data
+    assert shifted.get_pixel_value(0, 0) == reference.get_shifted(dx=2, dy=-5, wrap=True).get_pixel_value(0, 0)
+    assert shifted.grid == reference.get_shifted(dx=2, dy=-5, wrap=True).grid
+
+
+def test_to_wire_matches_device_layout():
+    # Arrange
+    rng = np.random.default_rng(0)
+    data = rng.integers(0, 2, (MATRIX_WIDTH, MATRIX_HEIGHT))
+    grid = Grid(init_grid=data.tolist())
+    expected = bytearray(39)
+    for x in range(MATRIX_WIDTH):
+        for y in range(MATRIX_HEIGHT):
+            if data[x, y]:
+                i = x + 9 * y
+                expected[i // 8] |= 1 << (i % 8)
+
+    # Act
+    wire = grid.to_wire()
+
+    # Assert
+    assert wire == bytes(expected)
+    assert grid.to_wire() is wire
+    grid.grid = np.zeros((MATRIX_WIDTH, MATRIX_HEIGHT), dtype=np.uint8)
+    assert grid.to_wire() == bytes(39)
+
+
+@pytest.mark.parametrize(
+    "arr,expected",
+    [
+        (np.ones((2, 3), dtype=bool), True),
+        (np.ones((2, 3), dtype=np.uint8), True),
+        (np.full((2, 3), 2, dtype=np.uint8), False),
+        (np.full((2, 3), -1, dtype=np.int64), False),
+        (np.full((2, 3), 1.0), True),
+        (np.full((2, 3), 0.5), False),
+        (np.ones((3, 2), dtype=np.uint8), False),
+    ],
+    ids=["bool", "uint8", "uint8_out_of_range", "negative_int", "float_binary", "float_fraction", "wrong_shape"]
+)
+def test_is_valid_grid_np(arr, expected):
+    # Act & Assert
+    assert grid_mod._is_valid_grid_np(arr, 2, 3) is expected
+
+
+def test_grid_to_bytes_is_the_same_key_for_every_form():
+    # Arrange
+    from is_matrix_forge.led_matrix.display.grid.helpers import grid_to_bytes
+    data = np.random.default_rng(1).integers(0, 2, (MATRIX_WIDTH, MATRIX_HEIGHT), dtype=np.uint8)
+    grid = Grid(init_grid=data)
+
+    # Act
+    keys = {grid_to_bytes(data), grid_to_bytes(data.tolist()), grid_to_bytes(grid)}
+
+    # Assert
+    assert keys == {grid.to_wire()}
+
+
+@pytest.mark.parametrize("use_kernel", [True, False], ids=["kernel", "numpy"])
+def test_animate_matches_repeated_shifts(monkeypatch, use_kernel):
+    # Arrange
+    monkeypatch.setattr(grid_mod, "HAS_NUMBA", use_kernel)
+    grid = Grid(width=3, height=4, init_grid=[[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 1, 1]])
+    overlay = Grid(width=3, height=4, init_grid=[[0, 0, 0, 1], [0, 0, 0, 0], [0, 0, 0, 0]])
+
+    # Act
+    frames = grid.animate(3, dy=1, overlay=overlay)
+
+    # Assert
+    expected, current = [], grid
+    for _ in range(3):
+        current = Grid(width=3, height=4, init_grid=current.get_shifted(dy=1).array | overlay.array)
+        expected.append(current.grid)
+    assert [frame.grid for frame in frames] == expected
+
+
+def test_init_from_grid_skips_revalidation(monkeypatch):
+    # Arrange
+    source = Grid(width=2, height=2, init_grid=[[1, 0], [0, 1]])
+    validator = Mock(return_value=True)
+    monkeypatch.setattr(grid_mod, "is_valid_grid", validator)
+
+    # Act
+    copy = Grid(width=2, height=2, init_grid=source)
+
+    # Assert
+    validator.assert_not_called()
+    assert copy.grid == source.grid
+    assert not np.shares_memory(copy.array, source.array)
+    with pytest.raises(ValueError):
+        Grid(width=3, height=2, init_grid=source)
+
+
+def test_helpers_is_valid_grid_accepts_grid():
+    # Arrange
+    from is_matrix_forge.led_matrix.display.grid.helpers import is_valid_grid
+    grid = Grid(width=2, height=3)
+
+    # Act / Assert
+    assert is_valid_grid(grid, 2, 3)
+    assert not is_valid_grid(grid, 3, 2)
+    assert np.asarray(grid).shape == (2, 3)
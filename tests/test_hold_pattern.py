@@ -0,0 +1,121 @@
+# tests/test_hold_pattern.py
+
+import threading
+
+import pytest
+
+from serial import SerialException
+from serial.tools.list_ports_common import ListPortInfo
+
+import is_matrix_forge.led_matrix.commands as commands_mod
+import is_matrix_forge.led_matrix.display.grid.helpers as helpers_mod
+from is_matrix_forge.led_matrix.constants import DISCONNECTED_DEVS
+
+
+PORT = "/dev/ttyACM0"
+
+
+class FakeSerial:
+    fail_opens = 0
+    drawn = None
+
+    def __init__(self, port, baudrate, **kwargs):
+        if FakeSerial.fail_opens:
+            FakeSerial.fail_opens -= 1
+            raise SerialException("could not open port")
+        self.is_open = True
+
+    def write(self, data):
+        FakeSerial.drawn.put(bytes(data))
+
+    def close(self):
+        self.is_open = False
+
+
+class Frames:
+    """Collects what the writer draws, letting a test wait for the next frame."""
+
+    def __init__(self):
+        self.items = []
+        self.cond = threading.Condition()
+
+    def put(self, item):
+        with self.cond:
+            self.items.append(item)
+            self.cond.notify_all()
+
+    def wait_for(self, count, timeout=5):
+        with self.cond:
+            assert self.cond.wait_for(lambda: len(self.items) >= count, timeout)
+            return self.items[count - 1]
+
+
+@pytest.fixture(autouse=True)
+def patch_serial(monkeypatch):
+    # No matrix is attached while testing; the writer draws into a FakeSerial
+    FakeSerial.fail_opens = 0
+    FakeSerial.drawn = Frames()
+    monkeypatch.setattr(commands_mod.serial, "Serial", FakeSerial)
+    monkeypatch.setattr(commands_mod, "enable_low_latency", lambda s: False)
+    commands_mod._PORT_POOL.clear()
+    DISCONNECTED_DEVS.clear()
+    yield
+    helpers_mod.release_hold(timeout=5)
+    commands_mod._PORT_POOL.clear()
+    DISCONNECTED_DEVS.clear()
+
+
+@pytest.fixture
+def dev():
+    return ListPortInfo(PORT)
+
+
+def blank(lit=None):
+    grid = [[0] * 34 for _ in range(9)]
+    if lit is not None:
+        grid[lit[0]][lit[1]] = 1
+    return grid
+
+
+def test_hold_pattern_update_reuses_writer(dev):
+    # Arrange
+    helpers_mod.hold_pattern(dev, blank(), reapply_interval=30)
+    first = FakeSerial.drawn.wait_for(1)
+    writer = helpers_mod._HOLD_WRITERS[PORT]
+
+    # Act
+    helpers_mod.hold_pattern(dev, blank(lit=(0, 0)), reapply_interval=30)
+    second = FakeSerial.drawn.wait_for(2)
+
+    # Assert
+    assert helpers_mod._HOLD_WRITERS[PORT] is writer
+    assert first != second
+    assert second[3] & 1
+
+
+def test_release_hold_stops_writer(dev):
+    # Arrange
+    helpers_mod.hold_pattern(dev, blank(), reapply_interval=30)
+    FakeSerial.drawn.wait_for(1)
+    writer = helpers_mod._HOLD_WRITERS[PORT]
+
+    # Act
+    helpers_mod.release_hold(dev, timeout=5)
+
+    # Assert
+    assert not writer.thread.is_alive()
+    assert PORT not in helpers_mod._HOLD_WRITERS
+
+
+def test_hold_pattern_survives_failed_open(dev):
+    # Arrange
+    FakeSerial.fail_opens = 1
+    helpers_mod.hold_pattern(dev, blank(), reapply_interval=0.05)
+
+    # Act
+    FakeSerial.drawn.wait_for(1)
+
+    # Assert
+    writer = helpers_mod._HOLD_WRITERS[PORT]
+    assert writer.thread.is_alive()
+    assert PORT not in DISCONNECTED_DEVS
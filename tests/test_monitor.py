@@ -0,0 +1,72 @@
+# tests/test_monitor.py
+
+import pytest
+from unittest.mock import Mock
+
+from serial.tools.list_ports_common import ListPortInfo
+
+import is_matrix_forge.monitor.monitor as monitor_mod
+from is_matrix_forge.monitor.monitor import PowerMonitor
+
+
+class FakeController:
+    def __init__(self, device, *args, **kwargs):
+        self.device = device
+        self.clear = Mock()
+
+
+@pytest.fixture(autouse=True)
+def patch_hardware(monkeypatch):
+    # No matrix is attached while testing; stand in for the device check and the controller
+    monkeypatch.setattr(monitor_mod, "check_device", lambda device: True)
+    monkeypatch.setattr(monitor_mod, "LEDMatrixController", FakeController)
+    yield
+
+
+@pytest.mark.parametrize(
+    "interval,expected",
+    [
+        (30, 30.0),
+        (0.5, 0.5),
+        ("12", 12.0),
+        (None, PowerMonitor.DEFAULT_CHECK_INTERVAL),
+    ],
+    ids=["int", "float", "str", "default"]
+)
+def test_battery_check_interval_from_init(interval, expected):
+    # Act
+    monitor = PowerMonitor(ListPortInfo("/dev/ttyACM0"), battery_check_interval=interval)
+
+    # Assert
+    assert monitor.battery_check_interval == expected
+    assert isinstance(monitor.battery_check_interval, float)
+
+
+def test_battery_check_interval_rejects_bad_type():
+    # Arrange
+    monitor = PowerMonitor(ListPortInfo("/dev/ttyACM0"))
+
+    # Act & Assert
+    with pytest.raises(TypeError):
+        monitor.battery_check_interval = [5]
+
+
+def test_run_power_monitor_threaded_returns_stoppable_monitor(monkeypatch):
+    # Arrange
+    import psutil
+    import is_matrix_forge.monitor.events as events_mod
+    from is_matrix_forge.monitor import run_power_monitor_threaded
+    monkeypatch.setattr(monitor_mod, "get_battery_info", lambda: psutil._common.sbattery(50, 1000, True))
+    monkeypatch.setattr(monitor_mod, "get_animate", lambda dev: False)
+    monkeypatch.setattr(monitor_mod, "ECH", Mock())
+    monkeypatch.setattr(events_mod, "handle_event", Mock())
+
+    # Act
+    monitor = run_power_monitor_threaded(ListPortInfo("/dev/ttyACM0"), battery_check_interval=60)
+    monitor.stop(without_salutation=True)
+
+    # Assert
+    assert isinstance(monitor, PowerMonitor)
+    assert monitor.thread.daemon
+    assert not monitor.thread.is_alive()
+    assert not monitor.running